@@ -1,72 +1,94 @@
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import Response
 from app.db.mongodb import get_database
-from app.models.business import BusinessModel
+from app.models.business import BusinessModel, BUSINESS_LIST_PROJECTION
+from app.utils.json_utils import dumps
+from app.utils.pagination import apply_cursor, next_cursor
 from typing import List, Optional
 from bson import ObjectId
+from functools import lru_cache
+import re
 
 router = APIRouter()
 
+@lru_cache(maxsize=1024)
+def _prefix_pattern(search: str, ignore_case: bool = False) -> re.Pattern:
+    """Anchored, escaped pattern for a search term (cached for repeated typeahead hits)"""
+    return re.compile("^" + re.escape(search), re.IGNORECASE if ignore_case else 0)
+
+def _build_query(
+    search: Optional[str],
+    category: Optional[str],
+    prefix: bool = False,
+    deep: bool = False
+) -> dict:
+    """Build the businesses filter shared by the list and count endpoints"""
+    query = {}
+    if search and prefix:
+        # Typeahead: a case-sensitive anchored prefix on the lowercased name is
+        # range-scanned on the name_lower index (an /i regex cannot be bounded).
+        # PyMongo encodes the compiled pattern directly as a BSON regex.
+        name_pattern = _prefix_pattern(search.lower())
+        if deep:
+            pattern = _prefix_pattern(search, ignore_case=True)
+            query["$or"] = [
+                {"name_lower": name_pattern},
+                {"address": pattern},
+                {"description": pattern}
+            ]
+        else:
+            query["name_lower"] = name_pattern
+    elif search:
+        # Served by the text index on name/address/description
+        query["$text"] = {"$search": search}
+    if category:
+        query["category"] = category
+    return query
+
 @router.get("/")
 async def get_businesses(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     limit: int = Query(100, ge=1, le=1000),
     search: Optional[str] = None,
+    prefix: bool = False,
+    deep: bool = False,
     category: Optional[str] = None,
     sort_by: str = Query("created_at", regex="^(name|created_at|updated_at)$"),
     sort_order: int = Query(-1, ge=-1, le=1)
 ):
     db = get_database()
     
-    # Build query
-    query = {}
-    if search:
-        query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"address": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
-        ]
-    if category:
-        query["category"] = category
+    query = _build_query(search, category, prefix, deep)
     
-    # Execute query
-    cursor = db.businesses.find(query).sort(sort_by, sort_order).skip(skip).limit(limit)
-    businesses = await cursor.to_list(length=limit)
+    try:
+        query = apply_cursor(query, sort_by, sort_order, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    # Clean up data for response
-    cleaned_businesses = []
-    for business in businesses:
-        # Convert ObjectId to string
-        if "_id" in business:
-            business["_id"] = str(business["_id"])
-        
-        # Ensure hours is either a dict or None
-        if "hours" in business and isinstance(business["hours"], str):
-            business["hours"] = {"text": business["hours"]}
-        
-        # Add default source_url if missing
-        if "source_url" not in business:
-            business["source_url"] = business.get("url", "")
-            
-        cleaned_businesses.append(business)
+    # Execute query; _id breaks ties so the cursor position is unambiguous.
+    # batch_size(limit) fetches the whole page in the first reply (default is 101)
+    businesses = await db.businesses.find(query, projection=BUSINESS_LIST_PROJECTION).sort(
+        [(sort_by, sort_order), ("_id", sort_order)]
+    ).limit(limit).batch_size(limit).to_list(length=limit)
+    page_cursor = next_cursor(businesses, sort_by, limit)
     
-    return cleaned_businesses
+    content = dumps({"items": businesses, "next_cursor": page_cursor})
+    return Response(content=content, media_type="application/json")
 
 @router.get("/count")
 async def get_businesses_count(
     search: Optional[str] = None,
+    prefix: bool = False,
+    deep: bool = False,
     category: Optional[str] = None
 ):
     db = get_database()
     
-    query = {}
-    if search:
-        query["$or"] = [
-            {"name": {"$regex": search, "$options": "i"}},
-            {"address": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}}
-        ]
-    if category:
-        query["category"] = category
+    # Unfiltered totals come from collection metadata instead of an index walk
+    if not search and not category:
+        return {"count": await db.businesses.estimated_document_count()}
+    
+    query = _build_query(search, category, prefix, deep)
     
     count = await db.businesses.count_documents(query)
     return {"count": count}
@@ -82,22 +104,15 @@ async def get_business(business_id: str):
     if not business:
         raise HTTPException(status_code=404, detail="Business not found")
     
-    # Convert ObjectId to string
-    business["_id"] = str(business["_id"])
-    
-    # Ensure hours is either a dict or None
-    if "hours" in business and isinstance(business["hours"], str):
-        business["hours"] = {"text": business["hours"]}
-    
-    # Add default source_url if missing
-    if "source_url" not in business:
-        business["source_url"] = business.get("url", "")
-        
-    return business
+    return Response(
+        content=dumps(business),
+        media_type="application/json"
+    )
 
 @router.get("/categories/list")
 async def get_categories():
     db = get_database()
     
-    categories = await db.businesses.distinct("category")
-    return {"categories": [cat for cat in categories if cat]}
\ No newline at end of file
+    # Served from the materialized counts instead of scanning businesses
+    cursor = db.category_counts.find({"count": {"$gt": 0}}, {"_id": 1}).sort("_id", 1)
+    return {"categories": [doc["_id"] async for doc in cursor if doc["_id"]]}
\ No newline at end of file
@@ -1,74 +1,86 @@
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response
 from app.db.mongodb import get_database
-from app.utils.json_utils import convert_mongo_doc, MongoJSONEncoder
+from app.models.job import JOB_SUMMARY_PROJECTION
+from app.utils.json_utils import dumps
 from typing import Dict, List
-from bson import ObjectId
+import asyncio
 import logging
-import json
+import time
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-def serialize_doc(doc):
-    """Convert MongoDB document to JSON-serializable format"""
-    if doc is None:
-        return None
-    if isinstance(doc, list):
-        return [serialize_doc(d) for d in doc]
-    if isinstance(doc, dict):
-        result = {}
-        for key, value in doc.items():
-            if isinstance(value, ObjectId):
-                result[key] = str(value)
-            elif isinstance(value, dict):
-                result[key] = serialize_doc(value)
-            elif isinstance(value, list):
-                result[key] = serialize_doc(value)
-            else:
-                result[key] = value
-        return result
-    return doc
+# Dashboard stats change slowly but are polled by every open dashboard, so
+# concurrent pollers share one aggregation per TTL window.
+STATS_CACHE_TTL_SECONDS = 10
+_stats_cache = {"ts": 0.0, "value": None}
+_stats_lock = asyncio.Lock()
+
+def _stats_cache_fresh() -> bool:
+    return (
+        _stats_cache["value"] is not None
+        and time.monotonic() - _stats_cache["ts"] < STATS_CACHE_TTL_SECONDS
+    )
+
+async def _compute_dashboard_stats() -> bytes:
+    """Run the dashboard aggregations and return the serialized JSON payload"""
+    db = get_database()
+    
+    # Job counts and recent jobs in a single round trip
+    jobs_pipeline = [
+        {"$facet": {
+            "by_status": [{"$group": {"_id": "$status", "count": {"$sum": 1}}}],
+            "recent": [
+                {"$sort": {"_id": -1}},
+                {"$limit": 5},
+                {"$project": JOB_SUMMARY_PROJECTION}
+            ]
+        }}
+    ]
+    
+    # The three reads are independent, so overlap their round trips. The
+    # category distribution is read from the category_counts collection
+    # maintained by the business writers.
+    jobs_facets, total_businesses, categories = await asyncio.gather(
+        db.jobs.aggregate(jobs_pipeline).to_list(length=1),
+        db.businesses.estimated_document_count(),
+        db.category_counts.find({"count": {"$gt": 0}}).sort("count", -1).limit(10).to_list(length=10)
+    )
+    jobs_facets = jobs_facets[0]
+    status_counts = {row["_id"]: row["count"] for row in jobs_facets["by_status"]}
+    total_jobs = sum(status_counts.values())
+    completed_jobs = status_counts.get("completed", 0)
+    failed_jobs = status_counts.get("failed", 0)
+    recent_jobs = jobs_facets["recent"]
+    
+    result = {
+        "stats": {
+            "total_businesses": total_businesses,
+            "total_jobs": total_jobs,
+            "completed_jobs": completed_jobs,
+            "failed_jobs": failed_jobs
+        },
+        "categories": [{"name": cat["_id"] or "Uncategorized", "count": cat["count"]} for cat in categories],
+        "recent_jobs": recent_jobs
+    }
+    
+    # orjson handles datetimes natively and only calls back for ObjectId
+    return dumps(result)
 
 @router.get("/stats")
 async def get_dashboard_stats() -> Dict:
     try:
-        db = get_database()
-        
-        # Get counts
-        total_businesses = await db.businesses.count_documents({})
-        total_jobs = await db.jobs.count_documents({})
-        completed_jobs = await db.jobs.count_documents({"status": "completed"})
-        failed_jobs = await db.jobs.count_documents({"status": "failed"})
-        
-        # Get category distribution
-        pipeline = [
-            {"$group": {"_id": "$category", "count": {"$sum": 1}}},
-            {"$sort": {"count": -1}},
-            {"$limit": 10}
-        ]
-        categories = await db.businesses.aggregate(pipeline).to_list(length=10)
-        
-        # Get recent jobs
-        recent_jobs = await db.jobs.find({}).sort("created_at", -1).limit(5).to_list(length=5)
-        
-        # Convert MongoDB documents to JSON-serializable format
-        recent_jobs_converted = [convert_mongo_doc(job) for job in recent_jobs]
+        if _stats_cache_fresh():
+            return Response(content=_stats_cache["value"], media_type="application/json")
         
-        result = {
-            "stats": {
-                "total_businesses": total_businesses,
-                "total_jobs": total_jobs,
-                "completed_jobs": completed_jobs,
-                "failed_jobs": failed_jobs
-            },
-            "categories": [{"name": cat["_id"] or "Uncategorized", "count": cat["count"]} for cat in categories],
-            "recent_jobs": recent_jobs_converted
-        }
+        async with _stats_lock:
+            # Another request may have refreshed the cache while we waited
+            if not _stats_cache_fresh():
+                _stats_cache["value"] = await _compute_dashboard_stats()
+                _stats_cache["ts"] = time.monotonic()
         
-        # Return as JSON response with custom encoder
-        json_str = json.dumps(result, cls=MongoJSONEncoder)
-        return Response(content=json_str, media_type="application/json")
+        return Response(content=_stats_cache["value"], media_type="application/json")
     except Exception as e:
         logger.error(f"Error in get_dashboard_stats: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
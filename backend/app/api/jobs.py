@@ -1,13 +1,12 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, HTTPException, BackgroundTasks, Query
 from fastapi.responses import Response
 from app.db.mongodb import get_database
-from app.models.job import JobModel, CreateJobRequest, JobStatus
+from app.models.job import JobModel, CreateJobRequest, JobStatus, JOB_SUMMARY_PROJECTION
 from app.services.job_runner import run_scraping_job
-from app.utils.json_utils import convert_mongo_doc, MongoJSONEncoder
+from app.utils.json_utils import dumps
+from app.utils.pagination import apply_cursor, next_cursor
 from typing import List, Optional
 from bson import ObjectId
-from datetime import datetime
-import json
 
 router = APIRouter()
 
@@ -20,7 +19,6 @@ async def create_job(job_request: CreateJobRequest, background_tasks: Background
         "type": job_request.type,
         "status": JobStatus.PENDING,
         "parameters": job_request.parameters,
-        "created_at": datetime.utcnow(),
         "current_step": 0,
         "total_steps": 0,
         "progress_message": None,
@@ -29,6 +27,7 @@ async def create_job(job_request: CreateJobRequest, background_tasks: Background
     
     result = await db.jobs.insert_one(job_data)
     job_data["_id"] = str(result.inserted_id)
+    job_data["created_at"] = result.inserted_id.generation_time
     
     # Add to background tasks
     background_tasks.add_task(run_scraping_job, str(result.inserted_id))
@@ -37,8 +36,8 @@ async def create_job(job_request: CreateJobRequest, background_tasks: Background
 
 @router.get("/")
 async def get_jobs(
-    skip: int = 0,
-    limit: int = 20,
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
     status: Optional[str] = None
 ):
     db = get_database()
@@ -47,12 +46,16 @@ async def get_jobs(
     if status:
         query["status"] = status
     
-    jobs = await db.jobs.find(query).sort("created_at", -1).skip(skip).limit(limit).to_list(length=limit)
-    # Convert MongoDB documents to JSON-serializable format
-    converted_jobs = [convert_mongo_doc(job) for job in jobs]
-    # Use custom JSON encoder for datetime and ObjectId
-    json_str = json.dumps(converted_jobs, cls=MongoJSONEncoder)
-    return Response(content=json_str, media_type="application/json")
+    try:
+        query = apply_cursor(query, "_id", -1, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # ObjectIds increase with insertion time, so _id order is newest-first order
+    jobs = await db.jobs.find(query, projection=JOB_SUMMARY_PROJECTION).sort("_id", -1).limit(limit).batch_size(limit).to_list(length=limit)
+    page_cursor = next_cursor(jobs, "_id", limit)
+    content = dumps({"items": jobs, "next_cursor": page_cursor})
+    return Response(content=content, media_type="application/json")
 
 @router.get("/{job_id}")
 async def get_job(job_id: str):
@@ -65,10 +68,9 @@ async def get_job(job_id: str):
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    # Convert MongoDB document to JSON-serializable format
-    converted_job = convert_mongo_doc(job)
-    json_str = json.dumps(converted_job, cls=MongoJSONEncoder)
-    return Response(content=json_str, media_type="application/json")
+    # Jobs created before created_at was dropped still carry the stored value
+    job.setdefault("created_at", job["_id"].generation_time)
+    return Response(content=dumps(job), media_type="application/json")
 
 @router.delete("/{job_id}")
 async def cancel_job(job_id: str):
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query
 from app.config import settings as app_settings
 from pydantic import BaseModel
+from typing import List
+import errno
 import os
 import litellm
 import asyncio
 
 router = APIRouter()
 
+# Upper bound on the test completion used to validate a new API key
+VALIDATION_TIMEOUT_SECONDS = 3.0
+
 class UpdateSettingsRequest(BaseModel):
     google_api_key: str
 
@@ -19,64 +24,114 @@ async def get_settings():
         "has_google_api_key": bool(app_settings.google_api_key)
     }
 
-@router.put("/")
-async def update_settings(request: UpdateSettingsRequest):
-    # Test the API key before saving
-    try:
-        test_response = await litellm.acompletion(
-            model="gemini/gemini-2.0-flash-exp",
-            api_key=request.google_api_key,
-            messages=[{"role": "user", "content": "Test"}],
-            max_tokens=10
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid API key: {str(e)}")
-    
-    # Update environment variable
-    os.environ["GOOGLE_API_KEY"] = request.google_api_key
-    
-    # Update settings
-    app_settings.google_api_key = request.google_api_key
-    
-    # Update .env file - check both possible locations
-    # Try Docker mounted path first
+def _resolve_env_path() -> str:
+    """Locate the .env file, preferring the Docker mounted path"""
     env_paths = [
         "/app/.env",  # Docker mounted volume
         os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".env")  # Local path
     ]
     
-    env_path = None
     for path in env_paths:
         if os.path.exists(path):
-            env_path = path
-            break
+            return path
     
-    if not env_path:
-        # If no .env exists, create one in the mounted volume
-        env_path = "/app/.env"
+    # If no .env exists, create one in the mounted volume
+    return "/app/.env"
+
+# Parsed .env lines keyed by (path, mtime_ns) so repeated PUTs skip the re-read
+_env_cache = {"key": None, "lines": []}
+
+def _read_env_lines(env_path: str) -> List[str]:
+    try:
+        mtime_ns = os.stat(env_path).st_mtime_ns
+    except FileNotFoundError:
+        return []
     
-    # Read existing .env file
-    if os.path.exists(env_path):
+    if _env_cache["key"] != (env_path, mtime_ns):
         with open(env_path, "r") as f:
-            lines = f.readlines()
-        
-        # Update or add GOOGLE_API_KEY
-        key_found = False
-        for i, line in enumerate(lines):
-            if line.startswith("GOOGLE_API_KEY="):
-                lines[i] = f"GOOGLE_API_KEY={request.google_api_key}\n"
-                key_found = True
-                break
-        
-        if not key_found:
-            lines.append(f"GOOGLE_API_KEY={request.google_api_key}\n")
-        
-        # Write back to file
-        with open(env_path, "w") as f:
-            f.writelines(lines)
+            _env_cache["lines"] = f.readlines()
+        _env_cache["key"] = (env_path, mtime_ns)
+    return list(_env_cache["lines"])
+
+def _write_env_lines_in_place(env_path: str, lines: List[str]) -> None:
+    """Rewrite the file through its existing inode (truncate + write)"""
+    with open(env_path, "w") as f:
+        f.writelines(lines)
+
+def _write_env_var(name: str, value: str) -> None:
+    """Set `name` in the .env file, replacing any existing entry atomically where possible"""
+    env_path = _resolve_env_path()
+    lines = _read_env_lines(env_path)
+    
+    # Update or add the variable
+    entry = f"{name}={value}\n"
+    for i, line in enumerate(lines):
+        if line.startswith(f"{name}="):
+            lines[i] = entry
+            break
     else:
-        # Create new .env file
-        with open(env_path, "w") as f:
-            f.write(f"GOOGLE_API_KEY={request.google_api_key}\n")
+        lines.append(entry)
+    
+    # Write to a temp file and swap it in so readers never see a partial file.
+    # A bind-mounted .env (docker-compose mounts ./.env as a single file) cannot be
+    # renamed over, so that case falls back to rewriting the file in place.
+    tmp_path = f"{env_path}.tmp"
+    try:
+        if os.path.ismount(env_path):
+            _write_env_lines_in_place(env_path, lines)
+        else:
+            with open(tmp_path, "w") as f:
+                f.writelines(lines)
+            try:
+                os.replace(tmp_path, env_path)
+            except OSError as e:
+                if e.errno not in (errno.EBUSY, errno.EXDEV):
+                    raise
+                _write_env_lines_in_place(env_path, lines)
+    finally:
+        # Only left behind when the swap did not happen
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+    
+    _env_cache["lines"] = lines
+    _env_cache["key"] = (env_path, os.stat(env_path).st_mtime_ns)
+
+@router.put("/")
+async def update_settings(request: UpdateSettingsRequest, validate: bool = Query(True)):
+    # Nothing to validate or persist when the key is unchanged
+    if app_settings.google_api_key == request.google_api_key:
+        return {"message": "Settings updated successfully"}
+    
+    # Test the API key before saving
+    if validate:
+        try:
+            await asyncio.wait_for(
+                litellm.acompletion(
+                    model="gemini/gemini-2.0-flash-exp",
+                    api_key=request.google_api_key,
+                    messages=[{"role": "user", "content": "Test"}],
+                    max_tokens=1
+                ),
+                timeout=VALIDATION_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail="Validation timed out")
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=f"Invalid API key: {str(e)}")
+    
+    # Persist to the .env file first, so a failed write leaves the old key in
+    # effect and the client can retry
+    try:
+        _write_env_var("GOOGLE_API_KEY", request.google_api_key)
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save settings: {str(e)}")
+    
+    # Update environment variable
+    os.environ["GOOGLE_API_KEY"] = request.google_api_key
+    
+    # Update settings
+    app_settings.google_api_key = request.google_api_key
     
-    return {"message": "Settings updated successfully"}
\ No newline at end of file
+    return {"message": "Settings updated successfully"}
@@ -1,7 +1,16 @@
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
 from app.config import settings
+from datetime import datetime, timezone
 import logging
 import asyncio
+import os
+import sys
+
+# Add parent directory to path to import the shared client from logs
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+from logs.mongodb_logging import get_motor_client, release_motor_client
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +23,9 @@ db = MongoDB()
 async def connect_to_mongo():
     try:
         logger.info(f"Connecting to MongoDB at {settings.mongodb_url}")
-        db.client = AsyncIOMotorClient(
+        # Shared with the scrapers' MongoDBClient and the log handlers; the
+        # timeouts apply because the API creates the client at startup
+        db.client = get_motor_client(
             settings.mongodb_url,
             serverSelectionTimeoutMS=5000,  # 5 second timeout
             connectTimeoutMS=5000
@@ -28,33 +39,169 @@ async def connect_to_mongo():
         # Create indexes if they don't exist
         await create_indexes()
         
+        # One-off rebuild of the materialized category counts
+        await backfill_category_counts()
+        
+        # One-off rewrite of legacy business shapes so reads can return documents as stored
+        await normalize_businesses()
+        
+        # One-off fill of the lowercased name used by prefix search
+        await backfill_name_lower()
+        
     except Exception as e:
         logger.error(f"Failed to connect to MongoDB: {str(e)}")
         logger.error("Make sure MongoDB is running on localhost:27017")
         raise
 
+async def _ensure_index(collection, keys, name: str, **kwargs):
+    """Create an index, rebuilding it if an existing index of that name has different options"""
+    try:
+        await collection.create_index(keys, name=name, **kwargs)
+    except OperationFailure as e:
+        # 85 = IndexOptionsConflict, 86 = IndexKeySpecsConflict
+        if e.code not in (85, 86):
+            raise
+        logger.info(f"Rebuilding index {name} with updated options")
+        await collection.drop_index(name)
+        await collection.create_index(keys, name=name, **kwargs)
+
 async def create_indexes():
     """Create database indexes for better performance"""
     try:
         # Businesses collection indexes
         await db.database.businesses.create_index("name")
-        await db.database.businesses.create_index("category")
+        # Lowercased name for the case-insensitive prefix search
+        await db.database.businesses.create_index("name_lower")
+        # Partial: documents without a category never reach the category queries
+        await _ensure_index(
+            db.database.businesses, "category", name="category_1",
+            partialFilterExpression={"category": {"$exists": True}}
+        )
         await db.database.businesses.create_index("created_at")
-        await db.database.businesses.create_index([("name", "text"), ("description", "text")])
+        await db.database.businesses.create_index([("created_at", -1), ("_id", -1)])
+        # Only one text index is allowed per collection, so replace the legacy one
+        business_indexes = await db.database.businesses.index_information()
+        if "name_text_description_text" in business_indexes:
+            await db.database.businesses.drop_index("name_text_description_text")
+        await db.database.businesses.create_index(
+            [("name", "text"), ("address", "text"), ("description", "text")]
+        )
+        
+        # Materialized category counts, read by the dashboard
+        await db.database.category_counts.create_index([("count", -1)])
         
         # Jobs collection indexes
-        await db.database.jobs.create_index("status")
-        await db.database.jobs.create_index("created_at")
+        # Status filter + newest-first sort in one index walk; jobs are ordered
+        # by _id (creation time), which the default _id index covers unfiltered
+        await db.database.jobs.create_index([("status", 1), ("_id", -1)])
+        # Superseded by the index above and the _id index
+        job_indexes = await db.database.jobs.index_information()
+        for name in ("status_1", "created_at_1", "status_1_created_at_-1__id_-1", "created_at_-1__id_-1"):
+            if name in job_indexes:
+                await db.database.jobs.drop_index(name)
         await db.database.jobs.create_index("type")
         
+        # Full job log history; jobs only embed the most recent entries
+        await db.database.job_logs.create_index([("job_id", 1), ("_id", 1)])
+        
         logger.info("Database indexes created/verified")
     except Exception as e:
         logger.warning(f"Could not create indexes: {str(e)}")
 
+async def _migration_applied(migration_id: str) -> bool:
+    """Whether a one-off data migration is recorded in the migrations collection"""
+    return await db.database.migrations.find_one({"_id": migration_id}, {"_id": 1}) is not None
+
+async def _mark_migration_applied(migration_id: str):
+    await db.database.migrations.update_one(
+        {"_id": migration_id},
+        {"$set": {"applied_at": datetime.now(timezone.utc)}},
+        upsert=True
+    )
+
+async def backfill_category_counts():
+    """Rebuild category_counts from businesses once, as a recorded migration.
+
+    Writers keep the collection current with $inc on insert/recategorize;
+    this counts businesses that predate the collection. Counts are replaced
+    rather than incremented, so $inc writes made before the first upgraded
+    start do not leave older businesses uncounted.
+    """
+    try:
+        if await _migration_applied("category_counts_v1"):
+            return
+        pipeline = [
+            {"$match": {"category": {"$exists": True, "$type": "string"}}},
+            {"$group": {"_id": "$category", "count": {"$sum": 1}}},
+            {"$merge": {"into": "category_counts", "whenMatched": "replace"}}
+        ]
+        await db.database.businesses.aggregate(pipeline).to_list(length=None)
+        await _mark_migration_applied("category_counts_v1")
+        logger.info("Category counts backfilled")
+    except Exception as e:
+        logger.warning(f"Could not backfill category counts: {str(e)}")
+
+async def normalize_businesses():
+    """Migrate string hours to {"text": ...} and fill missing source_url from url (runs once)"""
+    try:
+        if await _migration_applied("normalize_businesses_v1"):
+            return
+        hours = await db.database.businesses.update_many(
+            {"hours": {"$type": "string"}},
+            [{"$set": {"hours": {"text": "$hours"}}}]
+        )
+        source_url = await db.database.businesses.update_many(
+            {"source_url": {"$exists": False}},
+            [{"$set": {"source_url": {"$ifNull": ["$url", ""]}}}]
+        )
+        if hours.modified_count or source_url.modified_count:
+            logger.info(
+                f"Normalized businesses: {hours.modified_count} hours, "
+                f"{source_url.modified_count} source_url"
+            )
+        await _mark_migration_applied("normalize_businesses_v1")
+    except Exception as e:
+        logger.warning(f"Could not normalize businesses: {str(e)}")
+
+# Documents updated per bulk_write while backfilling name_lower
+NAME_LOWER_BATCH_SIZE = 1000
+
+async def backfill_name_lower():
+    """Store name_lower on businesses written before the field existed (runs once).
+
+    Lowercased in Python rather than with $toLower, which only handles ASCII,
+    so stored values match the lowercased search input.
+    """
+    try:
+        if await _migration_applied("business_name_lower_v1"):
+            return
+        cursor = db.database.businesses.find(
+            {"name": {"$type": "string"}, "name_lower": {"$exists": False}},
+            {"name": 1}
+        )
+        ops = []
+        updated = 0
+        async for doc in cursor:
+            ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"name_lower": doc["name"].lower()}}))
+            if len(ops) >= NAME_LOWER_BATCH_SIZE:
+                await db.database.businesses.bulk_write(ops, ordered=False)
+                updated += len(ops)
+                ops = []
+        if ops:
+            await db.database.businesses.bulk_write(ops, ordered=False)
+            updated += len(ops)
+        await _mark_migration_applied("business_name_lower_v1")
+        if updated:
+            logger.info(f"Backfilled name_lower on {updated} businesses")
+    except Exception as e:
+        logger.warning(f"Could not backfill business name_lower: {str(e)}")
+
 async def close_mongo_connection():
     if db.client:
         logger.info("Closing MongoDB connection")
-        db.client.close()
+        db.client = None
+        db.database = None
+        release_motor_client(settings.mongodb_url)
 
 def get_database():
     if db.database is None:
@@ -1,6 +1,20 @@
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Fields needed by business list views (plus the sort keys used for cursors)
+BUSINESS_LIST_PROJECTION = {
+    "name": 1,
+    "address": 1,
+    "phone": 1,
+    "category": 1,
+    "rating": 1,
+    "source_url": 1,
+    "url": 1,
+    "hours": 1,
+    "created_at": 1,
+    "updated_at": 1
+}
 
 class BusinessModel(BaseModel):
     id: Optional[str] = Field(alias="_id", default=None)
@@ -17,8 +31,8 @@ class BusinessModel(BaseModel):
     email: Optional[str] = None
     source_url: str
     source_name: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     class Config:
         populate_by_name = True
@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 class JobType(str, Enum):
@@ -14,6 +14,20 @@ class JobStatus(str, Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+# Fields needed by job list views; excludes the unbounded logs array and parameters.
+# created_at is not stored on jobs; it is derived from the ObjectId timestamp.
+JOB_SUMMARY_PROJECTION = {
+    "type": 1,
+    "status": 1,
+    "created_at": {"$toDate": "$_id"},
+    "started_at": 1,
+    "completed_at": 1,
+    "progress_message": 1,
+    "current_step": 1,
+    "total_steps": 1,
+    "error": 1
+}
+
 class JobModel(BaseModel):
     id: Optional[str] = Field(alias="_id", default=None)
     type: JobType
@@ -22,7 +36,7 @@ class JobModel(BaseModel):
     progress: Optional[Dict[str, Any]] = Field(default=None, description="Progress tracking with current_step, total_steps, message")
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     
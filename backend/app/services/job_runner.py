@@ -1,8 +1,11 @@
 import asyncio
 import sys
 import os
-from datetime import datetime
+import time
+from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import UpdateOne
+from typing import Optional, Union
 from app.db.mongodb import get_database
 from app.models.job import JobStatus, JobType
 import logging
@@ -12,59 +15,133 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(
 
 logger = logging.getLogger(__name__)
 
-async def update_job_progress(job_id: str, current_step: int, total_steps: int, message: str):
-    """Update job progress in the database"""
-    db = get_database()
+# Import scrapers once; a failure is reported per job instead of at startup
+try:
+    from scrapers.websites_scraping_with_db import process_website_urls
+    from scrapers.searches_scraping import process_search_terms, process_search_urls
+    _SCRAPERS_IMPORT_ERROR = None
+except ImportError as e:
+    logger.error(f"Failed to import scraper modules: {str(e)}")
+    _SCRAPERS_IMPORT_ERROR = e
+
+# Progress updates are queued and written in batches rather than one round trip each
+PROGRESS_FLUSH_INTERVAL_SECONDS = 0.2
+PROGRESS_BATCH_SIZE = 500
+# Only the newest entries stay embedded in the job; the full history is in job_logs
+JOB_LOG_LIMIT = 500
+
+_progress_queue: asyncio.Queue = asyncio.Queue()
+_flush_lock = asyncio.Lock()
+_flusher_task: Optional[asyncio.Task] = None
+# Last (step, total, message) queued per job, to drop repeated identical ticks
+_last_progress: dict = {}
+
+_iso_sec = (None, "")
+
+def _fast_isoformat() -> str:
+    """Current UTC time in ISO 8601, formatting the date/time part once per second"""
+    global _iso_sec
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    if sec != _iso_sec[0]:
+        _iso_sec = (sec, datetime.fromtimestamp(sec, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S"))
+    return f"{_iso_sec[1]}.{ns // 1000:06d}+00:00"
+
+def update_job_progress(job_id: Union[str, ObjectId], current_step: int, total_steps: int, message: str):
+    """Queue a job progress update; the flusher writes it to the database"""
+    if not isinstance(job_id, ObjectId):
+        job_id = ObjectId(job_id)
+    key = (current_step, total_steps, message)
+    if _last_progress.get(job_id) == key:
+        return
+    _last_progress[job_id] = key
     log_entry = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": _fast_isoformat(),
         "message": message,
         "step": current_step
     }
-    await db.jobs.update_one(
-        {"_id": ObjectId(job_id)},
-        {
-            "$set": {
-                "current_step": current_step,
-                "total_steps": total_steps,
-                "progress_message": message
-            },
-            "$push": {
-                "logs": log_entry
-            }
-        }
-    )
+    _progress_queue.put_nowait((job_id, {
+        "current_step": current_step,
+        "total_steps": total_steps,
+        "progress_message": message
+    }, log_entry))
+
+async def _flush_progress():
+    """Write up to PROGRESS_BATCH_SIZE queued updates as one bulk_write"""
+    async with _flush_lock:
+        batch = []
+        while len(batch) < PROGRESS_BATCH_SIZE and not _progress_queue.empty():
+            batch.append(_progress_queue.get_nowait())
+        if not batch:
+            return
+        
+        # One update per job: later fields win, log entries are appended in order
+        updates = {}
+        for job_id, fields, log_entry in batch:
+            update = updates.setdefault(job_id, {"set": {}, "logs": []})
+            update["set"].update(fields)
+            if log_entry:
+                update["logs"].append(log_entry)
+        
+        ops = []
+        history = []
+        for job_id, update in updates.items():
+            doc = {"$set": update["set"]}
+            if update["logs"]:
+                doc["$push"] = {"logs": {"$each": update["logs"], "$slice": -JOB_LOG_LIMIT}}
+                history.extend({"job_id": job_id, **entry} for entry in update["logs"])
+            ops.append(UpdateOne({"_id": job_id}, doc))
+        
+        db = get_database()
+        writes = [db.jobs.bulk_write(ops, ordered=False)]
+        if history:
+            writes.append(db.job_logs.insert_many(history, ordered=False))
+        await asyncio.gather(*writes)
+
+async def _progress_flusher():
+    while True:
+        await asyncio.sleep(PROGRESS_FLUSH_INTERVAL_SECONDS)
+        try:
+            await _flush_progress()
+        except Exception as e:
+            logger.error(f"Failed to write job progress: {str(e)}")
+
+def _ensure_progress_flusher():
+    global _flusher_task
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_progress_flusher())
+
+async def drain_job_progress():
+    """Write every queued progress update before a job's final status is set"""
+    while not _progress_queue.empty():
+        await _flush_progress()
+    # Wait out a batch the background flusher may still be writing
+    async with _flush_lock:
+        pass
 
 async def run_scraping_job(job_id: str):
     """Run a scraping job in the background"""
     db = get_database()
+    oid = ObjectId(job_id)
+    _ensure_progress_flusher()
     
     try:
-        # Update job status to running
-        await db.jobs.update_one(
-            {"_id": ObjectId(job_id)},
-            {"$set": {
-                "status": JobStatus.RUNNING, 
-                "started_at": datetime.utcnow(),
-                "current_step": 0,
-                "total_steps": 1,
-                "progress_message": "Initializing..."
-            }}
-        )
-        
         # Get job details
-        job = await db.jobs.find_one({"_id": ObjectId(job_id)})
+        job = await db.jobs.find_one({"_id": oid})
         if not job:
             logger.error(f"Job {job_id} not found")
             return
         
-        # Import scrapers
-        try:
-            from scrapers.websites_scraping_with_db import process_website_urls
-            from scrapers.searches_scraping import process_search_terms, process_search_urls
-            logger.info("Successfully imported scraper modules")
-        except ImportError as e:
-            logger.error(f"Failed to import scraper modules: {str(e)}")
-            raise Exception(f"Scraper modules not found. Please ensure the scrapers package is properly installed: {str(e)}")
+        # Mark the job as running; batched with the first progress update
+        _progress_queue.put_nowait((oid, {
+            "status": JobStatus.RUNNING,
+            "started_at": datetime.now(timezone.utc),
+            "current_step": 0,
+            "total_steps": 1,
+            "progress_message": "Initializing..."
+        }, None))
+        
+        if _SCRAPERS_IMPORT_ERROR is not None:
+            raise Exception(f"Scraper modules not found. Please ensure the scrapers package is properly installed: {str(_SCRAPERS_IMPORT_ERROR)}")
         
         result = None
         
@@ -73,7 +150,7 @@ async def run_scraping_job(job_id: str):
             urls = job["parameters"].get("urls", [])
             total_urls = len(urls)
             logger.info(f"Processing website job with {total_urls} URLs: {urls}")
-            await update_job_progress(job_id, 0, total_urls, f"Processing {total_urls} website URLs...")
+            update_job_progress(oid, 0, total_urls, f"Processing {total_urls} website URLs...")
             
             try:
                 result = await process_website_urls(urls, job_id=job_id)
@@ -87,37 +164,38 @@ async def run_scraping_job(job_id: str):
             if "terms" in job["parameters"]:
                 terms = job["parameters"]["terms"]
                 total_terms = len(terms)
-                await update_job_progress(job_id, 0, total_terms, f"Processing {total_terms} search terms...")
+                update_job_progress(oid, 0, total_terms, f"Processing {total_terms} search terms...")
                 
                 result = await process_search_terms(terms, job_id=job_id)
             elif "urls" in job["parameters"]:
                 urls = job["parameters"]["urls"]
                 total_urls = len(urls)
-                await update_job_progress(job_id, 0, total_urls, f"Processing {total_urls} search URLs...")
+                update_job_progress(oid, 0, total_urls, f"Processing {total_urls} search URLs...")
                 
                 result = await process_search_urls(urls, job_id=job_id)
                 
         elif job["type"] == JobType.PIPELINE:
             # Run full pipeline
             terms = job["parameters"].get("terms", [])
-            await update_job_progress(job_id, 0, 2, "Starting pipeline: Search phase...")
+            update_job_progress(oid, 0, 2, "Starting pipeline: Search phase...")
             
             # First, get URLs from search
             search_result = await process_search_terms(terms, job_id=job_id)
-            await update_job_progress(job_id, 1, 2, "Search complete. Starting scraping phase...")
+            update_job_progress(oid, 1, 2, "Search complete. Starting scraping phase...")
             
             if search_result and search_result.get("urls"):
                 # Then scrape the URLs
                 result = await process_website_urls(search_result["urls"], job_id=job_id)
-                await update_job_progress(job_id, 2, 2, "Pipeline complete!")
+                update_job_progress(oid, 2, 2, "Pipeline complete!")
         
         # Update job as completed
+        await drain_job_progress()
         await db.jobs.update_one(
-            {"_id": ObjectId(job_id)},
+            {"_id": oid},
             {
                 "$set": {
                     "status": JobStatus.COMPLETED,
-                    "completed_at": datetime.utcnow(),
+                    "completed_at": datetime.now(timezone.utc),
                     "result": result or {"message": "Job completed successfully"}
                 }
             }
@@ -125,13 +203,19 @@ async def run_scraping_job(job_id: str):
         
     except Exception as e:
         logger.error(f"Error running job {job_id}: {str(e)}")
+        try:
+            await drain_job_progress()
+        except Exception as drain_error:
+            logger.error(f"Failed to write job progress: {str(drain_error)}")
         await db.jobs.update_one(
-            {"_id": ObjectId(job_id)},
+            {"_id": oid},
             {
                 "$set": {
                     "status": JobStatus.FAILED,
-                    "completed_at": datetime.utcnow(),
+                    "completed_at": datetime.now(timezone.utc),
                     "error": str(e)
                 }
             }
-        )
\ No newline at end of file
+        )
+    finally:
+        _last_progress.pop(oid, None)
\ No newline at end of file
@@ -3,6 +3,17 @@ import json
 from datetime import datetime
 from bson import ObjectId
 from typing import Any
+import orjson
+
+def orjson_default(obj):
+    """orjson fallback for MongoDB types it cannot serialize natively"""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def dumps(obj: Any) -> bytes:
+    """Serialize MongoDB documents to JSON bytes; naive datetimes are stored as UTC"""
+    return orjson.dumps(obj, default=orjson_default, option=orjson.OPT_NAIVE_UTC)
 
 class MongoJSONEncoder(json.JSONEncoder):
     """Custom JSON encoder for MongoDB types"""
@@ -13,29 +24,25 @@ class MongoJSONEncoder(json.JSONEncoder):
             return obj.isoformat()
         return super().default(obj)
 
+# Top-level value converters, dispatched on exact type
+_CONVERTERS = {
+    ObjectId: str,
+    datetime: datetime.isoformat
+}
+
 def convert_mongo_doc(doc: dict) -> dict:
     """Convert MongoDB document to JSON-serializable format"""
     if not doc:
         return doc
     
-    # Convert ObjectId
-    if "_id" in doc:
-        doc["_id"] = str(doc["_id"])
-    
-    # Convert datetime fields
-    datetime_fields = ["created_at", "started_at", "completed_at", "updated_at"]
-    for field in datetime_fields:
-        if field in doc and doc[field] and isinstance(doc[field], datetime):
-            doc[field] = doc[field].isoformat()
-    
-    # Handle nested logs
-    if "logs" in doc and isinstance(doc["logs"], list):
-        for log in doc["logs"]:
-            if isinstance(log, dict) and "timestamp" in log:
-                if isinstance(log["timestamp"], datetime):
+    # Single pass over the document; nested logs only need their timestamps
+    for key, value in doc.items():
+        convert = _CONVERTERS.get(type(value))
+        if convert:
+            doc[key] = convert(value)
+        elif key == "logs" and type(value) is list:
+            for log in value:
+                if type(log) is dict and type(log.get("timestamp")) is datetime:
                     log["timestamp"] = log["timestamp"].isoformat()
-                elif isinstance(log["timestamp"], str):
-                    # Already a string, leave it as is
-                    pass
     
-    return doc
\ No newline at end of file
+    return doc
@@ -0,0 +1,51 @@
+"""Range-based (cursor) pagination helpers for MongoDB queries"""
+import base64
+import binascii
+from typing import Any, Optional, Tuple
+from bson import ObjectId, json_util
+
+def encode_cursor(value: Any, oid: ObjectId) -> str:
+    """Encode the last seen (sort value, _id) pair into an opaque cursor string"""
+    raw = json_util.dumps([value, oid]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def decode_cursor(cursor: str) -> Tuple[Any, ObjectId]:
+    """Decode a cursor produced by encode_cursor back into (sort value, _id)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii"))
+        value, oid = json_util.loads(raw.decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(oid, ObjectId):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return value, oid
+
+def apply_cursor(query: dict, sort_by: str, sort_order: int, cursor: Optional[str]) -> dict:
+    """Return `query` restricted to documents after `cursor` in (sort_by, _id) order.
+
+    The range filter lets MongoDB seek directly into the (sort_by, _id) index
+    instead of walking and discarding `skip` entries on every page.
+    """
+    if not cursor:
+        return query
+
+    value, oid = decode_cursor(cursor)
+    op = "$lt" if sort_order < 0 else "$gt"
+    if sort_by == "_id":
+        range_filter = {"_id": {op: oid}}
+    else:
+        range_filter = {"$or": [
+            {sort_by: {op: value}},
+            {sort_by: value, "_id": {op: oid}}
+        ]}
+
+    if not query:
+        return range_filter
+    return {"$and": [query, range_filter]}
+
+def next_cursor(items: list, sort_by: str, limit: int) -> Optional[str]:
+    """Build the cursor for the page following `items`, or None on the last page"""
+    if len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.get(sort_by), last["_id"])
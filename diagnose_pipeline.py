@@ -6,8 +6,11 @@ Diagnose pipeline issues
 import asyncio
 import os
 import sys
-import json
 import logging
+import re
+import traceback
+
+import orjson
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -19,6 +22,32 @@ from logs.custom_logging import setup_logging
 # Setup logging
 logger = setup_logging(console_level='DEBUG')
 
+# Characters of the Google response kept in google_response_sample.html
+SAMPLE_SIZE = 5000
+
+# Common blocking indicators, matched in one case-insensitive pass over the page
+GOOGLE_BLOCKING_PATTERN = re.compile(
+    "|".join(map(re.escape, [
+        "unusual traffic",
+        "captcha",
+        "sorry",
+        "automated requests",
+        "recaptcha"
+    ])),
+    re.IGNORECASE
+)
+
+def _content_size(content):
+    """Approximate size of scraped content without stringifying it"""
+    if isinstance(content, (str, bytes)):
+        return len(content)
+    if isinstance(content, dict):
+        return sum(len(v) for v in content.values() if isinstance(v, (str, bytes)))
+    try:
+        return len(content)
+    except TypeError:
+        return sys.getsizeof(content)
+
 async def diagnose_search_phase(search_term):
     """Test just the search phase"""
     logger.info(f"\n🔍 TESTING SEARCH PHASE for: '{search_term}'")
@@ -42,7 +71,7 @@ async def diagnose_search_phase(search_term):
                     logger.error(f"❌ Search scraping failed: {content.get('message')}")
                 else:
                     logger.info(f"✅ Successfully scraped search results")
-                    logger.info(f"   Content length: {len(str(content))}")
+                    logger.info(f"   Content length: {_content_size(content)}")
         
         # Now extract URLs
         extracted_urls = await scraper.scrape_and_extract_urls()
@@ -74,7 +103,6 @@ async def diagnose_search_phase(search_term):
         
     except Exception as e:
         logger.error(f"Search phase error: {str(e)}")
-        import traceback
         logger.error(traceback.format_exc())
         return []
 
@@ -102,7 +130,7 @@ async def test_specific_url():
                 
                 if entities:
                     logger.info("Sample entity:")
-                    logger.info(json.dumps(entities[0], indent=2, ensure_ascii=False))
+                    logger.info(orjson.dumps(entities[0], option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode())
                     
         return results
         
@@ -110,6 +138,11 @@ async def test_specific_url():
         logger.error(f"URL test error: {str(e)}")
         return []
 
+def _write_sample(path, html):
+    """Write the first SAMPLE_SIZE characters of a response for inspection"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(html[:SAMPLE_SIZE] if html else "No content")
+
 async def check_google_blocking():
     """Check if Google is blocking us"""
     logger.info("\n🚫 CHECKING FOR GOOGLE BLOCKING")
@@ -124,16 +157,7 @@ async def check_google_blocking():
         
         if status == 200:
             # Check for common blocking indicators
-            blocking_indicators = [
-                "unusual traffic",
-                "captcha",
-                "sorry",
-                "automated requests",
-                "recaptcha"
-            ]
-            
-            html_lower = html.lower() if html else ""
-            blocked = any(indicator in html_lower for indicator in blocking_indicators)
+            blocked = bool(html) and GOOGLE_BLOCKING_PATTERN.search(html) is not None
             
             if blocked:
                 logger.error("❌ Google appears to be blocking requests (CAPTCHA/rate limit)")
@@ -142,9 +166,8 @@ async def check_google_blocking():
                 
             logger.info(f"Response length: {len(html) if html else 0}")
             
-            # Save sample for debugging
-            with open("google_response_sample.html", "w", encoding="utf-8") as f:
-                f.write(html[:5000] if html else "No content")
+            # Save sample for debugging, off the event loop thread
+            await asyncio.to_thread(_write_sample, "google_response_sample.html", html)
             logger.info("Saved sample response to google_response_sample.html")
             
         else:
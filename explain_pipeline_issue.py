@@ -3,7 +3,9 @@
 Explain why the pipeline job found no results
 """
 
-import json
+import sys
+
+import orjson
 
 # The user's failed pipeline job
 failed_job = {
@@ -13,45 +15,6 @@ failed_job = {
     }
 }
 
-print("🔍 PIPELINE JOB ANALYSIS")
-print("=" * 60)
-print("\n❌ Why Your Pipeline Job Found No Results:\n")
-
-print("You created this job:")
-print(json.dumps(failed_job, indent=2))
-
-print("\nThe problem: You passed a URL as a search term!")
-print("Pipeline jobs expect search keywords, not URLs.")
-
-print("\n📊 How Each Job Type Works:")
-print("-" * 40)
-
-print("\n1️⃣ PIPELINE JOB (Search + Scrape)")
-print("   • Input: Search terms like 'ferreterias santo domingo'")
-print("   • Process: ")
-print("     1. Searches Google for these terms")
-print("     2. Extracts URLs from search results")
-print("     3. Scrapes those URLs for business data")
-print("   • Output: Business entities from found websites")
-
-print("\n2️⃣ WEBSITE JOB (Direct Scrape)")
-print("   • Input: Direct URLs to scrape")
-print("   • Process: ")
-print("     1. Goes directly to the URL")
-print("     2. Extracts business data from the page")
-print("   • Output: Business entities from the provided URLs")
-
-print("\n3️⃣ SEARCH JOB (Find URLs Only)")
-print("   • Input: Search terms")
-print("   • Process: ")
-print("     1. Searches Google for these terms")
-print("     2. Extracts URLs from results")
-print("   • Output: List of URLs (no scraping)")
-
-print("\n" + "=" * 60)
-print("✅ CORRECT WAYS TO GET YOUR DATA:")
-print("=" * 60)
-
 # Show the correct job for their URL
 correct_website_job = {
     "type": "website",
@@ -60,9 +23,6 @@ correct_website_job = {
     }
 }
 
-print("\nOption 1: Use a WEBSITE job with your URL")
-print(json.dumps(correct_website_job, indent=2))
-
 # Show correct pipeline job
 correct_pipeline_job = {
     "type": "pipeline", 
@@ -71,20 +31,70 @@ correct_pipeline_job = {
     }
 }
 
-print("\nOption 2: Use a PIPELINE job with search terms")
-print(json.dumps(correct_pipeline_job, indent=2))
-
-print("\n" + "=" * 60)
-print("💡 WHAT HAPPENED IN YOUR CASE:")
-print("=" * 60)
-print("\n1. You gave the pipeline a URL instead of search terms")
-print("2. The pipeline searched Google for that exact URL")
-print("3. Google doesn't return meaningful results when searching for URLs")
-print("4. No URLs were found in the search phase")
-print("5. The scraping phase had nothing to scrape")
-print("6. Job completed 'successfully' but with 0 results")
-
-print("\n🎯 RECOMMENDATION:")
-print("Since you already have the URL, use a WEBSITE job instead!")
-print("\nThe good news: I can see from 'ferreterias_job_result.json' that")
-print("when you used the correct job type, it found 15 businesses!")
\ No newline at end of file
+def _dump(obj):
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+# The whole report, written to stdout in a single call
+LINES = [
+    "🔍 PIPELINE JOB ANALYSIS",
+    "=" * 60,
+    "\n❌ Why Your Pipeline Job Found No Results:\n",
+
+    "You created this job:",
+    _dump(failed_job),
+
+    "\nThe problem: You passed a URL as a search term!",
+    "Pipeline jobs expect search keywords, not URLs.",
+
+    "\n📊 How Each Job Type Works:",
+    "-" * 40,
+
+    "\n1️⃣ PIPELINE JOB (Search + Scrape)",
+    "   • Input: Search terms like 'ferreterias santo domingo'",
+    "   • Process: ",
+    "     1. Searches Google for these terms",
+    "     2. Extracts URLs from search results",
+    "     3. Scrapes those URLs for business data",
+    "   • Output: Business entities from found websites",
+
+    "\n2️⃣ WEBSITE JOB (Direct Scrape)",
+    "   • Input: Direct URLs to scrape",
+    "   • Process: ",
+    "     1. Goes directly to the URL",
+    "     2. Extracts business data from the page",
+    "   • Output: Business entities from the provided URLs",
+
+    "\n3️⃣ SEARCH JOB (Find URLs Only)",
+    "   • Input: Search terms",
+    "   • Process: ",
+    "     1. Searches Google for these terms",
+    "     2. Extracts URLs from results",
+    "   • Output: List of URLs (no scraping)",
+
+    "\n" + "=" * 60,
+    "✅ CORRECT WAYS TO GET YOUR DATA:",
+    "=" * 60,
+
+    "\nOption 1: Use a WEBSITE job with your URL",
+    _dump(correct_website_job),
+
+    "\nOption 2: Use a PIPELINE job with search terms",
+    _dump(correct_pipeline_job),
+
+    "\n" + "=" * 60,
+    "💡 WHAT HAPPENED IN YOUR CASE:",
+    "=" * 60,
+    "\n1. You gave the pipeline a URL instead of search terms",
+    "2. The pipeline searched Google for that exact URL",
+    "3. Google doesn't return meaningful results when searching for URLs",
+    "4. No URLs were found in the search phase",
+    "5. The scraping phase had nothing to scrape",
+    "6. Job completed 'successfully' but with 0 results",
+
+    "\n🎯 RECOMMENDATION:",
+    "Since you already have the URL, use a WEBSITE job instead!",
+    "\nThe good news: I can see from 'ferreterias_job_result.json' that",
+    "when you used the correct job type, it found 15 businesses!",
+]
+
+sys.stdout.write("\n".join(LINES) + "\n")
@@ -4,11 +4,18 @@ Logging Utility for YouTube Scraper
 Provides a function to set up logging with configurable levels for console and file output,
 featuring a custom formatter for visually distinct console logs.
 """
+import atexit
+import copy
 import logging
+import logging.handlers
 import os
+import queue
 import re
+import time
 from typing import Optional
 
+import orjson
+
 # --- Custom Formatter for Console Output ---
 
 # Replace the existing PrettyFormatter class with this one:
@@ -26,12 +33,18 @@ class PrettyFormatter(logging.Formatter):
     }
     MIN_BORDER_WIDTH = 40 # Minimum width for the border
     PADDING = 2 # Spaces inside border on each side
+    # Built once and shared by every record
+    _ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+    _BASIC_FMT = logging.Formatter('%(message)s')
+    # Padding never exceeds the minimum border width, so every run of spaces is precomputed
+    _SPACES = tuple(' ' * n for n in range(MIN_BORDER_WIDTH + 1))
+    # Borders by width; very long messages are built without caching
+    _BORDER_CACHE_MAX_WIDTH = 512
+    _border_cache = {}
 
     def format(self, record):
         # Use a basic formatter to get the raw message
-        log_fmt = '%(message)s'
-        basic_formatter = logging.Formatter(log_fmt)
-        message = basic_formatter.format(record)
+        message = self._BASIC_FMT.format(record)
 
         # --- Prepare components and calculate lengths ---
         level_color = self.COLORS.get(record.levelname, '')
@@ -43,8 +56,7 @@ class PrettyFormatter(logging.Formatter):
         prefix_len = len(level_prefix_text) # Length of the text part of the prefix
 
         # Get the displayable message content (remove color codes if any were in original message)
-        ansi_escape = re.compile(r'\x1b\[[0-9;]*m')
-        displayed_content = ansi_escape.sub('', message)
+        displayed_content = self._ANSI_ESCAPE.sub('', message) if '\x1b' in message else message
         content_len = len(displayed_content)
 
         # --- Calculate total width and border ---
@@ -52,7 +64,11 @@ class PrettyFormatter(logging.Formatter):
         total_content_width = prefix_len + 1 + content_len
         # Border needs to encompass content + padding on both sides
         border_len = max(total_content_width + (self.PADDING * 2), self.MIN_BORDER_WIDTH)
-        border = '=' * border_len
+        border = self._border_cache.get(border_len)
+        if border is None:
+            border = '=' * border_len
+            if border_len <= self._BORDER_CACHE_MAX_WIDTH:
+                self._border_cache[border_len] = border
 
         # --- Construct the content line ---
         # Calculate remaining space within the border for padding around the content
@@ -67,7 +83,7 @@ class PrettyFormatter(logging.Formatter):
 
         # Build the final line within the borders
         # Padding(L) + Prefix + Space + Content + Padding(R)
-        inner_line = f"{' ' * pad_left}{colored_prefix} {colored_content}{' ' * pad_right}"
+        inner_line = f"{self._SPACES[pad_left]}{colored_prefix} {colored_content}{self._SPACES[pad_right]}"
 
         # Ensure the constructed inner_line fits within the available space, accounting for color codes
         # This part is tricky; the easiest way is often to rely on the length calculations being correct
@@ -75,12 +91,55 @@ class PrettyFormatter(logging.Formatter):
         # of `inner_line`, but let's try the simpler calculation first.
 
         # Add the outer padding inside the border
-        final_line_content = f"{' ' * self.PADDING}{inner_line}{' ' * self.PADDING}"
+        outer_padding = self._SPACES[self.PADDING]
+        final_line_content = f"{outer_padding}{inner_line}{outer_padding}"
 
 
         # Assemble final output
         return f"\n{border}\n{final_line_content}\n{border}\n"
 
+# --- JSON Formatter for File Output ---
+
+class JsonFormatter(logging.Formatter):
+    """Formats each record as one JSON line, reusing the timestamp string within a second."""
+
+    DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+    def __init__(self):
+        super().__init__()
+        self._last_sec = None
+        self._last_str = ''
+
+    def format(self, record):
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_sec = sec
+            self._last_str = time.strftime(self.DATEFMT, time.localtime(sec))
+
+        entry = {
+            "ts": self._last_str,
+            "lvl": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+class ExcInfoQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that leaves exception info on the record for the listener's formatter.
+
+    The stock prepare() folds the traceback into msg and clears exc_info, which
+    would hide it from JsonFormatter's separate "exc" field.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        # Merge args in the calling thread, as QueueHandler does
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 # --- Logging Setup Function ---
 
 def setup_logging(
@@ -134,14 +193,18 @@ def setup_logging(
                 log_file_path = os.path.join(log_dir, log_file)
 
                 file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
-                # Use a standard formatter for the file log
-                file_formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    datefmt='%Y-%m-%d %H:%M:%S' # Standard date format
-                )
-                file_handler.setFormatter(file_formatter)
+                # One JSON object per line for the file log
+                file_handler.setFormatter(JsonFormatter())
                 file_handler.setLevel(file_level) # Set file handler level
-                logger.addHandler(file_handler)
+
+                # Callers only enqueue; a listener thread does the disk writes
+                log_queue = queue.SimpleQueue()
+                queue_handler = ExcInfoQueueHandler(log_queue)
+                queue_handler.setLevel(file_level)
+                logger.addHandler(queue_handler)
+                listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+                listener.start()
+                atexit.register(listener.stop)
             except Exception as e:
                 # Log error if file handler setup fails, but continue with console logging
                 logger.error(f"Failed to set up file logging to {log_file_path}: {e}", exc_info=True)
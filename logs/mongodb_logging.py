@@ -6,47 +6,158 @@ This module provides a custom logging handler that saves log records to MongoDB.
 
 import logging
 import os
-from datetime import datetime
+import queue
+import sys
+import time
+from datetime import datetime, timezone
 from motor.motor_asyncio import AsyncIOMotorClient
 import asyncio
 from typing import Optional
 
+# One pooled client per MongoDB URL, shared by every handler, the scrapers'
+# MongoDBClient and the backend instead of each opening its own connections.
+# Entries are [client, references]; the client closes with its last reference.
+MOTOR_MAX_POOL_SIZE = 32
+_motor_clients = {}
+
+def get_motor_client(mongodb_url: str, **client_options) -> AsyncIOMotorClient:
+    """Take a reference to the shared Motor client for `mongodb_url`.
+
+    The client is created on first use; `client_options` only apply then.
+    Every call must be paired with release_motor_client().
+    """
+    entry = _motor_clients.get(mongodb_url)
+    if entry is None:
+        client_options.setdefault("maxPoolSize", MOTOR_MAX_POOL_SIZE)
+        entry = [AsyncIOMotorClient(mongodb_url, **client_options), 0]
+        _motor_clients[mongodb_url] = entry
+    entry[1] += 1
+    return entry[0]
+
+def release_motor_client(mongodb_url: str):
+    """Drop one reference to the shared client, closing it after the last one"""
+    entry = _motor_clients.get(mongodb_url)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _motor_clients[mongodb_url]
+        entry[0].close()
+
+# Queued by aclose() to tell the consumer to write its last batch and return
+_STOP = object()
+
+def _drain(q: queue.SimpleQueue, max_items: int, timeout: float) -> list:
+    """Block up to `timeout` for one record, then take whatever else is queued.
+
+    Stops early at _STOP, which is left as the last item of the batch.
+    """
+    try:
+        batch = [q.get(timeout=timeout)]
+    except queue.Empty:
+        return []
+    while len(batch) < max_items and batch[-1] is not _STOP:
+        try:
+            batch.append(q.get_nowait())
+        except queue.Empty:
+            break
+    return batch
+
 class MongoDBHandler(logging.Handler):
-    """Custom logging handler that saves logs to MongoDB"""
+    """Custom logging handler that saves logs to MongoDB.
+
+    `emit` only puts records on a thread-safe queue, so it is safe and cheap
+    from any thread. A single consumer coroutine drains the queue off the
+    event loop and writes batches with insert_many.
+    """
     
-    def __init__(self, mongodb_url: Optional[str] = None, database_name: Optional[str] = None):
+    def __init__(
+        self,
+        mongodb_url: Optional[str] = None,
+        database_name: Optional[str] = None,
+        batch_size: int = 1000,
+        flush_interval: float = 0.5,
+        max_queue: int = 10000,
+        degrade_seconds: float = 30.0
+    ):
         super().__init__()
         self.mongodb_url = mongodb_url or os.getenv("MONGODB_URL", "mongodb://localhost:27017")
         self.database_name = database_name or os.getenv("DATABASE_NAME", "ui_scraper")
         self.client = None
         self.database = None
         self.collection = None
-        self._loop = None
-        self._connect_task = None
-        
-    def _get_event_loop(self):
-        """Get or create event loop"""
-        try:
-            return asyncio.get_running_loop()
-        except RuntimeError:
-            if self._loop is None:
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
-            return self._loop
+        self._q = queue.SimpleQueue()
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._consumer_task = None
+        # Backpressure: past the high-water mark only WARNING+ is queued, and
+        # nothing past max_queue; after a failed write, DEBUG/INFO are skipped
+        # for degrade_seconds without being formatted
+        self._max_queue = max_queue
+        self._high_water = int(max_queue * 0.8)
+        self._degrade_seconds = degrade_seconds
+        self._degraded_until = 0.0
     
     async def _connect(self):
-        """Connect to MongoDB"""
-        if not self.client:
-            self.client = AsyncIOMotorClient(self.mongodb_url)
+        """Take a reference to the shared MongoDB client on first use"""
+        if self.client is None:
+            self.client = get_motor_client(self.mongodb_url)
             self.database = self.client[self.database_name]
             self.collection = self.database.logs
     
+    def _release(self):
+        """Give back the shared client reference taken by _connect"""
+        if self.client is not None:
+            self.client = None
+            self.database = None
+            self.collection = None
+            release_motor_client(self.mongodb_url)
+    
+    async def _write(self, batch: list):
+        try:
+            await self._connect()
+            await self.collection.insert_many(batch, ordered=False)
+        except Exception as e:
+            self._degraded_until = time.monotonic() + self._degrade_seconds
+            print(f"MongoDB logging error: {e}", file=sys.stderr)
+    
+    async def _consume(self):
+        await self._connect()
+        while True:
+            batch = await asyncio.to_thread(_drain, self._q, self._batch_size, self._flush_interval)
+            stop = bool(batch) and batch[-1] is _STOP
+            if stop:
+                batch.pop()
+            if batch:
+                await self._write(batch)
+            if stop:
+                self._release()
+                return
+    
+    def start(self):
+        """Start the consumer on the running event loop, if there is one yet"""
+        if self._consumer_task is not None and not self._consumer_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop yet; records stay queued until one is running
+            return
+        self._consumer_task = loop.create_task(self._consume())
+    
     def emit(self, record):
-        """Emit a log record to MongoDB"""
+        """Queue a log record for the next MongoDB batch"""
+        # Shed load before paying for formatting
+        if record.levelno < logging.WARNING:
+            if time.monotonic() < self._degraded_until or self._q.qsize() > self._high_water:
+                return
+        elif self._q.qsize() >= self._max_queue:
+            return
+        
         try:
             # Format the log record
             log_entry = {
-                "timestamp": datetime.utcnow(),
+                "timestamp": datetime.fromtimestamp(record.created, timezone.utc),
                 "level": record.levelname,
                 "logger": record.name,
                 "message": self.format(record),
@@ -62,35 +173,47 @@ class MongoDBHandler(logging.Handler):
             if record.exc_info:
                 log_entry["exception"] = self.format(record)
             
-            # Get event loop and ensure connection
-            loop = self._get_event_loop()
-            
-            # Create connection task if needed
-            if not self._connect_task:
-                self._connect_task = asyncio.run_coroutine_threadsafe(self._connect(), loop)
-                self._connect_task.result(timeout=5)  # Wait for connection
-            
-            # Insert log entry
-            if self.collection:
-                asyncio.run_coroutine_threadsafe(
-                    self.collection.insert_one(log_entry),
-                    loop
-                )
+            self._q.put_nowait(log_entry)
+            if self._consumer_task is None or self._consumer_task.done():
+                self.start()
                 
         except Exception as e:
             # Fallback to stderr if MongoDB logging fails
-            import sys
             print(f"MongoDB logging error: {e}", file=sys.stderr)
             self.handleError(record)
     
+    async def aclose(self):
+        """Stop the consumer and write any remaining records.
+
+        The consumer is stopped through the queue rather than cancelled, so a
+        batch its worker thread has already taken is still written.
+        """
+        task, self._consumer_task = self._consumer_task, None
+        if task is not None and not task.done():
+            self._q.put_nowait(_STOP)
+            await task
+        if not self._q.empty():
+            await self._connect()
+            while not self._q.empty():
+                batch = [r for r in _drain(self._q, self._batch_size, 0) if r is not _STOP]
+                if batch:
+                    await self._write(batch)
+        self._release()
+    
     def close(self):
-        """Close the MongoDB connection"""
-        if self.client:
-            loop = self._get_event_loop()
-            asyncio.run_coroutine_threadsafe(
-                self.client.close(),
-                loop
-            )
+        """Stop the handler and drop its reference to the shared client"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop:
+            loop.create_task(self.aclose())
+        else:
+            if self._consumer_task is not None and not self._consumer_task.done():
+                # Its loop is not running; the consumer stops at _STOP if it resumes
+                self._q.put_nowait(_STOP)
+            self._consumer_task = None
+            self._release()
         super().close()
 
 def setup_mongodb_logging(level=logging.INFO):
@@ -104,6 +227,7 @@ def setup_mongodb_logging(level=logging.INFO):
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     mongo_handler.setFormatter(formatter)
+    mongo_handler.start()
     
     # Add handler to root logger
     root_logger = logging.getLogger()
@@ -40,42 +40,37 @@ Created: June 2023
 
 import os
 import sys
-import json
 import asyncio
-from dataclasses import dataclass, field
+import mmap
+import orjson
+from dataclasses import dataclass, field, replace
+from functools import cached_property, lru_cache, partial
 from enum import Enum
-from typing import List, Dict, Any, Optional, Union
+from typing import TYPE_CHECKING, ClassVar, Iterable, List, Dict, Any, Optional, Sequence, Set, Tuple, Union
 from pathlib import Path
-# Add project root to path
-project_root = os.path.dirname(os.path.abspath(__file__))
-sys.path.append(project_root)
+
+try:
+    import ijson  # Optional: incremental parsing of large JSON input lists
+except ImportError:
+    ijson = None
+
+try:
+    import uvloop  # Optional: libuv-backed event loop for high-concurrency scraping
+except ImportError:
+    uvloop = None
 
 # Import project modules
 import logging
 import argparse
-from scrapers.websites_scraping import (
-    create_website_scraper, 
-    WebsiteScrapingConfig,
-    WebsitesScraping
-)
-from scrapers.searches_scraping import (
-    create_search_scraper, 
-    SearchScrapingConfig,
-    SearchResultsScraper
-)
-from scrapers.claude_advance_searches_generator_exp import (
-    AdvancedGoogleSearchGenerator, 
-    SearchConfig, 
-    SearchType
-)
-from scrapers.llm_data_extraction import (
-    ExtractionConfig,
-    Crawl4AIConfig
-)
 from logs.custom_logging import setup_logging
-from utils.helpers import save_output_data
 from schemas.search_schema import SearchExtractionResult
 
+# Scraper modules pull in crawl4ai, LLM clients and browser drivers, so they are
+# imported where they are used rather than at startup
+if TYPE_CHECKING:
+    from scrapers.websites_scraping import WebsiteScrapingConfig
+    from scrapers.searches_scraping import SearchScrapingConfig
+
 
 # Constants
 DEFAULT_CONFIG_FILE = "crawler_config.json"
@@ -84,6 +79,57 @@ DEFAULT_OUTPUT_DIR = "output"
 DEFAULT_MAX_CONCURRENT = 3
 DEFAULT_BATCH_SIZE = 5
 DEFAULT_RETRY_ATTEMPTS = 2
+# Input files offered by the interactive menu
+INPUT_FILES = {
+    "websites": Path(DEFAULT_INPUT_DIR) / "website_urls_list.json",
+    "terms": Path(DEFAULT_INPUT_DIR) / "search_terms_list.json",
+    "urls": Path(DEFAULT_INPUT_DIR) / "search_urls_list.json",
+}
+# Concurrent website requests for the interactive menu; override with SCRAPER_CONCURRENCY
+DEFAULT_SCRAPER_CONCURRENCY = 25
+# Input entries starting with one of these are search URLs rather than search terms
+URL_SCHEMES = ("http://", "https://")
+# Website scraper runs run_pipeline keeps in flight; each is also bounded by max_concurrent
+PIPELINE_MAX_SCRAPE_BATCHES = 2
+# Most URLs one run_pipeline scraper run takes from the queue
+PIPELINE_SCRAPE_BATCH_URLS = 100
+# Website scraping methods accepted at the interactive prompts
+SCRAPING_METHODS = frozenset(("direct", "crawl4ai"))
+
+# Interactive banner and menu, built once and written in a single call
+MENU_BANNER = (
+    "\n" + "=" * 60 + "\n"
+    + "\U0001F916 AI-POWERED BUSINESS DATA CRAWLER".center(60) + "\n"
+    + "=" * 60 + "\n\n"
+)
+MENU_OPTIONS = (
+    "Select an option:\n"
+    "1. Scrape websites (from website_urls_list.json)\n"
+    "2. Scrape search results (from search_terms_list.json)\n"
+    "3. Scrape search results (from search_urls_list.json)\n"
+    "4. Run full pipeline (search \u2192 extract URLs \u2192 scrape websites)\n"
+    "5. Exit\n"
+)
+PIPELINE_HEADER = (
+    "\n--- Full Pipeline ---\n"
+    "Select input file for pipeline:\n"
+    "1. search_terms_list.json\n"
+    "2. search_urls_list.json\n"
+)
+
+# Read buffer for input files; larger than the 8 KB default to cut read() calls
+INPUT_BUFFER_SIZE = 64 * 1024
+# Array files larger than this are parsed incrementally with ijson, when installed
+STREAM_PARSE_MIN_BYTES = 8 * 1024 * 1024
+
+# Parse errors raised by the JSON readers used in load_input_data
+JSON_DECODE_ERRORS = (orjson.JSONDecodeError,) + ((ijson.JSONError,) if ijson else ())
+
+
+@lru_cache(maxsize=8)
+def _read_custom_config(path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a custom config file, cached per modification time"""
+    return orjson.loads(path.read_bytes())
 
 
 class ScrapeMethod(str, Enum):
@@ -92,7 +138,7 @@ class ScrapeMethod(str, Enum):
     CRAWL4AI = "crawl4ai"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CrawlerConfig:
     """Configuration for the AI-powered business data crawler
 
@@ -125,18 +171,21 @@ class CrawlerConfig:
     timeout: int = 30
     custom_config: Optional[Path] = None
 
+    # Output directories already created in this process
+    _created_dirs: ClassVar[Set[Path]] = set()
+
     def __post_init__(self):
         """Validate and process configuration after initialization"""
-        # Convert string paths to Path objects
-        if isinstance(self.output_dir, str):
-            self.output_dir = Path(self.output_dir)
-        if isinstance(self.input_file, str):
-            self.input_file = Path(self.input_file)
-        if isinstance(self.custom_config, str):
-            self.custom_config = Path(self.custom_config)
+        # Convert string paths to Path objects (frozen, so bypass __setattr__)
+        for name in ("output_dir", "input_file", "custom_config"):
+            value = getattr(self, name)
+            if isinstance(value, str):
+                object.__setattr__(self, name, Path(value))
 
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Create output directory if it doesn't exist (once per process)
+        if self.output_dir not in self._created_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(self.output_dir)
 
         # Load custom config if specified
         if self.custom_config and self.custom_config.exists():
@@ -144,14 +193,17 @@ class CrawlerConfig:
 
     def _load_custom_config(self):
         """Load and apply settings from custom config file"""
-        with open(self.custom_config) as f:
-            custom_config = json.load(f)
-            for key, value in custom_config.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
-
-    def to_website_config(self) -> WebsiteScrapingConfig:
-        """Convert to website scraping configuration"""
+        custom_config = _read_custom_config(self.custom_config, self.custom_config.stat().st_mtime_ns)
+        for key, value in custom_config.items():
+            if hasattr(self, key):
+                object.__setattr__(self, key, value)
+
+    @cached_property
+    def website_config(self) -> "WebsiteScrapingConfig":
+        """Website scraping configuration, built once per config"""
+        from scrapers.websites_scraping import WebsiteScrapingConfig
+        from scrapers.llm_data_extraction import ExtractionConfig
+        
         return WebsiteScrapingConfig(
             max_concurrent_requests=self.max_concurrent,
             extraction_config=ExtractionConfig(
@@ -160,54 +212,111 @@ class CrawlerConfig:
             )
         )
 
-    def to_search_config(self) -> SearchScrapingConfig:
-        """Convert to search scraping configuration"""
+    @cached_property
+    def search_config(self) -> "SearchScrapingConfig":
+        """Search scraping configuration, built once per config"""
+        from scrapers.searches_scraping import SearchScrapingConfig
+        
         return SearchScrapingConfig(
             max_concurrent_searches=self.max_concurrent,
             default_results_per_page=self.batch_size
         )
 
 
-# Initialize logging
-logger = setup_logging(
-    console_level=logging.DEBUG if "--debug" in sys.argv else logging.INFO
-)
+# Shared crawler logger; handlers are attached by setup_logging() at startup
+logger = logging.getLogger("YouTubeScraper")
+
+
+def _write_payload(path: Path, payload: bytes) -> None:
+    """Write a serialized payload with raw os.write calls, bypassing the buffered writer"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            # os.write may write less than asked for; continue from where it stopped
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _starts_with_array(path: Path) -> bool:
+    """Check whether a JSON file's top-level value is an array"""
+    with open(path, "rb") as f:
+        head = f.read(64).lstrip(b"\xef\xbb\xbf \t\r\n")
+    return head.startswith(b"[")
+
+
+def _loads_mapped(f) -> Any:
+    """Parse a JSON file through a read-only memory map"""
+    if os.fstat(f.fileno()).st_size == 0:
+        # Empty files cannot be mapped; let orjson report the decode error
+        return orjson.loads(b"")
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return orjson.loads(view)
 
 
-def load_input_data(path: Union[str, Path], expected_type: str = "list") -> Union[List[str], Dict[str, Any]]:
+def load_input_data(path: Union[str, Path], expected_type: str = "list") -> Union[Tuple[str, ...], Dict[str, Any]]:
     """Load and validate input data from a JSON file.
 
     This function handles loading both list-based (URLs, search terms) and 
     dictionary-based (configuration) JSON files, with type validation.
+    Files ending in `.jsonl` are read as one JSON value per line, and JSON
+    arrays over STREAM_PARSE_MIN_BYTES are parsed incrementally with ijson
+    when it is installed.
+    Parsed files are cached until their modification time changes.
 
     Args:
         path: Path to the JSON file to load
         expected_type: Expected data type ("list" or "dict")
 
     Returns:
-        List of strings or dictionary, depending on expected_type
+        Tuple of strings or dictionary, depending on expected_type
 
     Raises:
-        ValueError: If file doesn't exist or content doesn't match expected type
-        json.JSONDecodeError: If file contains invalid JSON
+        ValueError: If file doesn't exist, contains invalid JSON, or content
+            doesn't match expected type
     """
     path = Path(path) if isinstance(path, str) else path
     
-    if not path.exists():
-        raise ValueError(f"Input file not found: {path}")
-        
+    # The stat doubles as the existence check and supplies the cache key
     try:
-        with open(path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"Invalid JSON in {path}: {e}")
+        data = _parse_input_file(path, path.stat().st_mtime_ns, expected_type)
+    except FileNotFoundError:
+        raise ValueError(f"Input file not found: {path}")
             
-    if expected_type == "list" and not isinstance(data, list):
+    if expected_type == "list" and not isinstance(data, tuple):
         raise ValueError(f"Expected list in {path}, got {type(data)}")
     elif expected_type == "dict" and not isinstance(data, dict):
         raise ValueError(f"Expected dict in {path}, got {type(data)}")
-            
-    return data
+    
+    # Arrays are cached as immutable tuples; dicts are copied to protect the cache
+    return data if isinstance(data, tuple) else data.copy()
+
+
+@lru_cache(maxsize=8)
+def _parse_input_file(path: Path, mtime_ns: int, expected_type: str) -> Any:
+    """Parse an input file, cached per modification time so edits are picked up"""
+    try:
+        if path.suffix == ".jsonl":
+            with open(path, "rb", buffering=INPUT_BUFFER_SIZE) as f:
+                data = [orjson.loads(line) for line in f if line.strip()]
+        elif (
+            ijson is not None
+            and expected_type == "list"
+            and path.stat().st_size > STREAM_PARSE_MIN_BYTES
+            and _starts_with_array(path)
+        ):
+            with open(path, "rb", buffering=INPUT_BUFFER_SIZE) as f:
+                data = list(ijson.items(f, "item", use_float=True))
+        else:
+            # orjson parses the memory-mapped file in place, without a bytes copy
+            with open(path, "rb") as f:
+                data = _loads_mapped(f)
+    except JSON_DECODE_ERRORS as e:
+        raise ValueError(f"Invalid JSON in {path}: {e}")
+    
+    # Input lists are only read, so store them without list over-allocation
+    return tuple(data) if isinstance(data, list) else data
 
 
 def parse_arguments() -> CrawlerConfig:
@@ -353,8 +462,7 @@ def parse_arguments() -> CrawlerConfig:
             # Create temporary file with search terms
             terms_file = Path(DEFAULT_INPUT_DIR) / "temp_search_terms.json"
             terms_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(terms_file, "w") as f:
-                json.dump(args.terms, f)
+            _write_payload(terms_file, orjson.dumps(args.terms))
             input_file = terms_file
     
     # Create and return config object
@@ -375,24 +483,27 @@ def parse_arguments() -> CrawlerConfig:
 
 # Functions to parse arguments, load input data, etc. defined above...
 
-async def scrape_websites(config: CrawlerConfig) -> None:
+async def scrape_websites(config: CrawlerConfig, urls: Optional[Sequence[str]] = None) -> None:
     """Execute website scraping operation
 
     Args:
         config: Crawler configuration
+        urls: URLs to scrape; loaded from config.input_file when not given
     """
     logger.info("Starting website scraping operation...")
     
     # Load website URLs
-    try:
-        urls = load_input_data(config.input_file, "list")
-    except ValueError as e:
-        logger.error(f"Failed to load URLs: {e}")
-        return
+    if urls is None:
+        try:
+            urls = await asyncio.to_thread(load_input_data, config.input_file, "list")
+        except ValueError as e:
+            logger.error(f"Failed to load URLs: {e}")
+            return
     
     logger.info(f"Starting website scraping with method '{config.method}' for {len(urls)} URLs")
     
     # Create and configure website scraper
+    from scrapers.websites_scraping import create_website_scraper
     website_scraper = create_website_scraper(
         urls=urls,
         scraping_method=config.method.value,
@@ -403,14 +514,38 @@ async def scrape_websites(config: CrawlerConfig) -> None:
     # Execute scraping and extraction
     results = await website_scraper.scrape_and_extract_data(
         extraction_method='crawl4ai',
-        save_results=True,
-        output_dir=config.output_dir,
-        save_raw=config.save_raw
+        save_results=True
     )
     
     logger.info(f"Website scraping completed. Processed {len(results)} websites.")
 
 
+async def _load_search_input_file(config: CrawlerConfig) -> Optional[Dict[str, List[str]]]:
+    """Load config.input_file as search_urls or search_terms keyword arguments"""
+    try:
+        # Input could be either terms or URLs depending on CLI args
+        search_input = await asyncio.to_thread(load_input_data, config.input_file, "list")
+    except ValueError as e:
+        logger.error(f"Failed to load search input: {e}")
+        return None
+    
+    # Split the input into URLs and terms in one pass, then run on whichever applies
+    search_urls, search_terms = [], []
+    for item in search_input:
+        if isinstance(item, str) and item.startswith(URL_SCHEMES):
+            search_urls.append(item)
+        else:
+            search_terms.append(item)
+    
+    if search_urls:
+        if search_terms:
+            logger.warning(f"Ignoring {len(search_terms)} non-URL entries in a search URL list")
+        logger.info(f"Processing {len(search_urls)} search URLs")
+        return {"search_urls": search_urls}
+    logger.info(f"Processing {len(search_terms)} search terms")
+    return {"search_terms": search_terms}
+
+
 async def scrape_searches(config: CrawlerConfig) -> Optional[List[SearchExtractionResult]]:
     """Execute search scraping operation
 
@@ -422,39 +557,50 @@ async def scrape_searches(config: CrawlerConfig) -> Optional[List[SearchExtracti
     """
     logger.info("Starting search scraping operation...")
     
-    try:
-        # Input could be either terms or URLs depending on CLI args
-        search_input = load_input_data(config.input_file, "list")
-    except ValueError as e:
-        logger.error(f"Failed to load search input: {e}")
+    search_input = await _load_search_input_file(config)
+    if search_input is None:
         return None
     
     # Create and configure search scraper
+    from scrapers.searches_scraping import create_search_scraper
     search_scraper = create_search_scraper(
-        scraping_config=config.to_search_config()
+        scraping_config=config.search_config
+    )
+    search_results = await search_scraper.extract_business_urls_from_searches(
+        llm_extraction_method='crawl4ai',
+        **search_input
     )
-    
-    # Execute search based on input type
-    if any(isinstance(x, str) and x.startswith(('http://', 'https://')) for x in search_input):
-        logger.info(f"Processing {len(search_input)} search URLs")
-        search_results = await search_scraper.extract_business_urls_from_searches(
-            search_urls=search_input,
-            llm_extraction_method='crawl4ai'
-        )
-    else:
-        logger.info(f"Processing {len(search_input)} search terms")
-        search_results = await search_scraper.extract_business_urls_from_searches(
-            search_terms=search_input,
-            llm_extraction_method='crawl4ai'
-        )
     
     # Count and report results
-    total_urls = sum(len(result.urls) for result in search_results if hasattr(result, 'urls'))
+    total_urls = sum(len(result.urls) for result in search_results)
     logger.info(f"Search scraping completed. Found {total_urls} business URLs.")
     
     return search_results
 
 
+def _dedup_urls(
+    search_results: Iterable[SearchExtractionResult],
+    seen: Optional[Set[str]] = None
+) -> List[str]:
+    """
+    Website URLs from search results in first-seen order, without duplicates.
+    
+    URLs already in `seen` are skipped and new ones are added to it, so a caller
+    consuming results incrementally can pass the same set for each batch.
+    """
+    if seen is None:
+        seen = set()
+    # dict.fromkeys keeps first-seen order and runs the hashing in C
+    new_urls = dict.fromkeys(
+        url_info.url
+        for result in search_results
+        for url_info in result.urls
+        if url_info.url and url_info.url not in seen
+    )
+    seen.update(new_urls)
+    return list(new_urls)
+
+
 async def run_pipeline(config: CrawlerConfig) -> None:
     """Execute the full pipeline operation
 
@@ -463,54 +609,77 @@ async def run_pipeline(config: CrawlerConfig) -> None:
     """
     logger.info("Starting full pipeline operation...")
     
-    # Step 1: Extract URLs from search results
-    search_results = await scrape_searches(config)
-    if not search_results:
-        logger.error("Pipeline terminated: No search results found")
+    search_input = await _load_search_input_file(config)
+    if search_input is None:
         return
     
-    # Step 2: Extract and deduplicate website URLs
-    website_urls = []
-    for result in search_results:
-        if hasattr(result, 'urls'):
-            for url_info in result.urls:
-                if hasattr(url_info, 'url') and url_info.url not in website_urls:
-                    website_urls.append(url_info.url)
+    from scrapers.searches_scraping import create_search_scraper
+    search_scraper = create_search_scraper(scraping_config=config.search_config)
     
-    if not website_urls:
-        logger.error("Pipeline terminated: No website URLs extracted")
-        return
+    # Custom config values were already applied to config, so don't reload them
+    website_config = replace(config, mode="website", input_file=None, custom_config=None)
+    # New URLs per search result; None tells a worker to stop
+    url_queue: asyncio.Queue = asyncio.Queue()
     
-    logger.info(f"Extracted {len(website_urls)} unique website URLs")
-    
-    # Create temporary file with website URLs
-    urls_file = Path(DEFAULT_INPUT_DIR) / "temp_website_urls.json"
-    urls_file.parent.mkdir(parents=True, exist_ok=True)
-    with open(urls_file, "w") as f:
-        json.dump(website_urls, f)
-    
-    # Update config for website scraping
-    website_config = CrawlerConfig(
-        mode="website",
-        method=config.method,
-        input_file=urls_file,
-        output_dir=config.output_dir,
-        max_concurrent=config.max_concurrent,
-        batch_size=config.batch_size,
-        retry_attempts=config.retry_attempts,
-        save_raw=config.save_raw,
-        debug=config.debug,
-        timeout=config.timeout
-    )
+    async def scrape_worker() -> None:
+        # Take everything queued while the previous run was busy, so results
+        # that arrive close together share one scraper run and one save
+        stop = False
+        while not stop:
+            urls = await url_queue.get()
+            if urls is None:
+                return
+            while len(urls) < PIPELINE_SCRAPE_BATCH_URLS and not url_queue.empty():
+                more = url_queue.get_nowait()
+                if more is None:
+                    stop = True
+                    break
+                urls.extend(more)
+            await scrape_websites(website_config, urls=urls)
     
-    # Step 3: Scrape websites
-    await scrape_websites(website_config)
+    # Steps 1-3: scrape newly found website URLs while the remaining searches
+    # are still being extracted
+    search_result_count = 0
+    seen = set()
+    async with asyncio.TaskGroup() as scrape_tasks:
+        for _ in range(PIPELINE_MAX_SCRAPE_BATCHES):
+            scrape_tasks.create_task(scrape_worker())
+        try:
+            async for result in search_scraper.extract_business_urls_from_searches_iter(
+                llm_extraction_method='crawl4ai',
+                **search_input
+            ):
+                search_result_count += 1
+                new_urls = _dedup_urls((result,), seen)
+                if new_urls:
+                    url_queue.put_nowait(new_urls)
+        finally:
+            for _ in range(PIPELINE_MAX_SCRAPE_BATCHES):
+                url_queue.put_nowait(None)
     
-    # Clean up temporary file
-    try:
-        urls_file.unlink()
-    except OSError:
-        pass
+    if not search_result_count:
+        logger.error("Pipeline terminated: No search results found")
+    elif not seen:
+        logger.error("Pipeline terminated: No website URLs extracted")
+    else:
+        logger.info(f"Pipeline completed. Scraped {len(seen)} unique website URLs")
+
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin on a worker thread so the event loop keeps running"""
+    return await asyncio.to_thread(input, prompt)
+
+
+def _scripted_choices() -> List[str]:
+    """Menu choices from SCRAPER_CHOICES; empty for an interactive run"""
+    return [c.strip() for c in os.environ.get("SCRAPER_CHOICES", "").split(",") if c.strip()]
+
+
+async def _answer(prompt: str, env_var: str, default: str) -> str:
+    """Prompt for an answer, or read it from `env_var` (else `default`) in a scripted run"""
+    if _scripted_choices():
+        return os.environ.get(env_var, default).strip()
+    return await ainput(prompt)
 
 
 async def main():
@@ -519,200 +688,206 @@ async def main():
     Parses command line arguments, sets up configuration,
     and executes the requested operation mode.
     """
-    print("\n" + "="*60)
-    print("🤖 AI-POWERED BUSINESS DATA CRAWLER".center(60))
-    print("="*60 + "\n")
-    
-    print("Select an option:")
-    print("1. Scrape websites (from website_urls_list.json)")
-    print("2. Scrape search results (from search_terms_list.json)")
-    print("3. Scrape search results (from search_urls_list.json)")
-    print("4. Run full pipeline (search → extract URLs → scrape websites)")
-    print("5. Exit")
-    
-    choice = input("\nEnter your choice (1-5): ")
-    
-    if choice == "1":
-        # Website scraping
-        print("\n--- Website Scraping ---")
-        
-        # Load website URLs
-        urls = load_input_data("input/website_urls_list.json")
-        if not urls:
-            print("No URLs found in input/website_urls_list.json. Exiting.")
-            return
-        
-        # Select scraping method
-        method = input("Select scraping method (direct/crawl4ai) [default: direct]: ").lower() or "direct"
-        if method not in ["direct", "crawl4ai"]:
-            method = "direct"
-        
-        print(f"\nStarting website scraping with method '{method}' for {len(urls)} URLs...")
-        
-        # Create website scraper
-        website_scraper = create_website_scraper(
-            urls=urls,
-            scraping_method=method,
-            max_concurrent_requests=3
-        )
-        
-        # Execute scraping and extraction
-        results = await website_scraper.scrape_and_extract_data(
-            extraction_method='crawl4ai',
-            save_results=True
-        )
-        
-        print(f"Website scraping completed. Processed {len(results)} websites.")
-        
-    elif choice == "2":
-        # Search scraping with search terms
-        print("\n--- Search Scraping (using search terms) ---")
-        
-        # Load search terms
-        search_terms = load_input_data("input/search_terms_list.json")
-        if not search_terms:
-            print("No search terms found in input/search_terms_list.json. Exiting.")
-            return
-        
-        print(f"\nStarting search scraping for {len(search_terms)} search terms...")
-        
-        # Create search scraper
-        search_scraper = create_search_scraper()
-        
-        # Execute search extraction
-        results = await search_scraper.extract_business_urls_from_searches(
-            search_terms=search_terms,
-            llm_extraction_method='crawl4ai'
-        )
-        
-        # Count extracted URLs
-        total_urls = sum(len(result.urls) for result in results if hasattr(result, 'urls'))
-        print(f"Search scraping completed. Found {total_urls} business URLs.")
-        
-    elif choice == "3":
-        # Search scraping with search URLs
-        print("\n--- Search Scraping (using search URLs) ---")
-        
-        # Load search URLs
-        search_urls = load_input_data("input/search_urls_list.json")
-        if not search_urls:
-            print("No search URLs found in input/search_urls_list.json. Exiting.")
-            return
-        
-        print(f"\nStarting search scraping for {len(search_urls)} search URLs...")
-        
-        # Create search scraper
-        search_scraper = create_search_scraper()
-        
-        # Execute search extraction
-        results = await search_scraper.extract_business_urls_from_searches(
-            search_urls=search_urls,
-            llm_extraction_method='crawl4ai'
-        )
-        
-        # Count extracted URLs
-        total_urls = sum(len(result.urls) for result in results if hasattr(result, 'urls'))
-        print(f"Search scraping completed. Found {total_urls} business URLs.")
-        
-    elif choice == "4":
-        # Full pipeline
-        print("\n--- Full Pipeline ---")
-        
-        # Ask which input file to use
-        print("Select input file for pipeline:")
-        print("1. search_terms_list.json")
-        print("2. search_urls_list.json")
-        
-        file_choice = input("\nEnter your choice (1-2): ")
-        
-        if file_choice == "1":
-            # Load search terms
-            search_terms = load_input_data("input/search_terms_list.json")
-            if not search_terms:
-                print("No search terms found in input/search_terms_list.json. Exiting.")
+    concurrency = int(os.environ.get("SCRAPER_CONCURRENCY", DEFAULT_SCRAPER_CONCURRENCY))
+    scripted_choices = _scripted_choices()
+    
+    if not scripted_choices:
+        sys.stdout.write(MENU_BANNER + MENU_OPTIONS)
+    
+    # Load every menu input while the user is choosing; unused loads are discarded
+    prefetched = prefetch_input_files(INPUT_FILES)
+    try:
+        choices = scripted_choices or [await ainput("\nEnter your choice (1-5): ")]
+        for choice in choices:
+            handler = MENU_HANDLERS.get(choice)
+            if handler is None:
+                print("Invalid choice. Exiting.")
                 return
-            
-            print(f"\nStarting pipeline with {len(search_terms)} search terms...")
-            
-            # Create search scraper
-            search_scraper = create_search_scraper()
-            
-            # Step 1: Extract business URLs from search results
-            search_results = await search_scraper.extract_business_urls_from_searches(
-                search_terms=search_terms,
-                llm_extraction_method='crawl4ai'
-            )
-            
-        elif file_choice == "2":
-            # Load search URLs
-            search_urls = load_input_data("input/search_urls_list.json")
-            if not search_urls:
-                print("No search URLs found in input/search_urls_list.json. Exiting.")
+            await handler(prefetched, concurrency)
+            if handler is _handle_exit:
                 return
-            
-            print(f"\nStarting pipeline with {len(search_urls)} search URLs...")
-            
-            # Create search scraper
-            search_scraper = create_search_scraper()
-            
-            # Step 1: Extract business URLs from search results
-            search_results = await search_scraper.extract_business_urls_from_searches(
-                search_urls=search_urls,
-                llm_extraction_method='crawl4ai'
-            )
-            
-        else:
-            print("Invalid choice. Exiting.")
-            return
-        
-        if not search_results:
-            print("No search results found. Pipeline terminated.")
-            return
-        
-        # Step 2: Extract website URLs from search results
-        website_urls = []
-        for result in search_results:
-            if hasattr(result, 'urls'):
-                for url_info in result.urls:
-                    if hasattr(url_info, 'url') and url_info.url not in website_urls:
-                        website_urls.append(url_info.url)
-        
-        if not website_urls:
-            print("No website URLs extracted. Pipeline terminated.")
-            return
-        
-        print(f"Extracted {len(website_urls)} unique website URLs from search results.")
-        
-        # Step 3: Select scraping method for websites
-        method = input("Select website scraping method (direct/crawl4ai) [default: direct]: ").lower() or "direct"
-        if method not in ["direct", "crawl4ai"]:
-            method = "direct"
-        
-        # Step 4: Scrape websites
-        print(f"Starting website scraping with method '{method}' for {len(website_urls)} URLs...")
-        
-        # Create website scraper
-        website_scraper = create_website_scraper(
-            urls=website_urls,
-            scraping_method=method,
-            max_concurrent_requests=3
-        )
-        
-        # Execute scraping and extraction
-        results = await website_scraper.scrape_and_extract_data(
-            extraction_method='crawl4ai',
-            save_results=True
-        )
-        
-        print(f"Pipeline completed successfully. Processed {len(results)} websites.")
-        
-    elif choice == "5":
-        print("Exiting program.")
+    finally:
+        for task in prefetched.values():
+            _discard_prefetch(task)
+
+
+def prefetch_input_files(files: Dict[str, Path]) -> Dict[str, asyncio.Task]:
+    """
+    Start loading each input file in its own worker thread.
+    
+    The loads run in parallel, so file reads overlap instead of stacking up;
+    await the task for a name to get its parsed data.
+    """
+    return {
+        name: asyncio.create_task(asyncio.to_thread(load_input_data, path))
+        for name, path in files.items()
+    }
+
+
+async def _require_input(prefetched: Dict[str, asyncio.Task], name: str) -> Tuple[Any, ...]:
+    """Await a prefetched input file, logging a missing or invalid file instead of raising"""
+    try:
+        return await prefetched[name]
+    except ValueError as e:
+        logger.error(f"Could not load {INPUT_FILES[name]}: {e}")
+        return ()
+
+
+def _discard_prefetch(task: asyncio.Task) -> None:
+    """Cancel a prefetch task and mark any error it raised as retrieved"""
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def _prompt_scraping_method(prompt: str) -> str:
+    """Ask for a website scraping method (SCRAPER_METHOD when scripted), falling back to 'direct'"""
+    method = (await _answer(prompt, "SCRAPER_METHOD", "direct")).strip().lower()
+    return method if method in SCRAPING_METHODS else "direct"
+
+
+async def _scrape_menu_websites(urls: Sequence[str], method: str, concurrency: int) -> None:
+    """Scrape websites for a menu option through the shared CLI code path"""
+    config = CrawlerConfig(mode="website", method=ScrapeMethod(method), max_concurrent=concurrency)
+    await scrape_websites(config, urls=urls)
+
+
+async def _handle_websites(prefetched: Dict[str, asyncio.Task], concurrency: int) -> None:
+    """Scrape websites listed in the website URLs input file"""
+    print("\n--- Website Scraping ---")
+    
+    # Load website URLs
+    urls = await _require_input(prefetched, "websites")
+    if not urls:
+        print(f"No URLs found in {INPUT_FILES['websites']}. Exiting.")
         return
-        
-    else:
+    
+    method = await _prompt_scraping_method("Select scraping method (direct/crawl4ai) [default: direct]: ")
+    print(f"\nStarting website scraping with method '{method}' for {len(urls)} URLs...")
+    await _scrape_menu_websites(urls, method, concurrency)
+
+
+# Search input file -> (extract_business_urls_from_searches keyword, display label)
+SEARCH_INPUTS = {
+    "terms": ("search_terms", "search terms"),
+    "urls": ("search_urls", "search URLs"),
+}
+
+
+async def _load_search_input(prefetched: Dict[str, asyncio.Task], name: str) -> Optional[Dict[str, Any]]:
+    """Load a search input file as extraction keyword arguments, or None if it is empty"""
+    keyword, label = SEARCH_INPUTS[name]
+    search_input = await _require_input(prefetched, name)
+    if not search_input:
+        print(f"No {label} found in {INPUT_FILES[name]}. Exiting.")
+        return None
+    return {keyword: search_input}
+
+
+async def _handle_search(name: str, prefetched: Dict[str, asyncio.Task], concurrency: int) -> None:
+    """Extract business URLs from searches for one search input file"""
+    keyword, label = SEARCH_INPUTS[name]
+    print(f"\n--- Search Scraping (using {label}) ---")
+    
+    search_input = await _load_search_input(prefetched, name)
+    if search_input is None:
+        return
+    
+    print(f"\nStarting search scraping for {len(search_input[keyword])} {label}...")
+    
+    # Create search scraper and execute search extraction
+    from scrapers.searches_scraping import create_search_scraper
+    search_scraper = create_search_scraper()
+    results = await search_scraper.extract_business_urls_from_searches(
+        llm_extraction_method='crawl4ai',
+        **search_input
+    )
+    
+    # Count extracted URLs
+    total_urls = sum(len(result.urls) for result in results)
+    print(f"Search scraping completed. Found {total_urls} business URLs.")
+
+
+async def _handle_pipeline(prefetched: Dict[str, asyncio.Task], concurrency: int) -> None:
+    """Run the full search, URL extraction and website scraping pipeline"""
+    # Ask which input file to use
+    sys.stdout.write(PIPELINE_HEADER)
+    
+    # Scripted runs name the input in SCRAPER_PIPELINE_INPUT ("terms" or "urls")
+    file_choice = await _answer("\nEnter your choice (1-2): ", "SCRAPER_PIPELINE_INPUT", "terms")
+    name = {"1": "terms", "2": "urls"}.get(file_choice, file_choice)
+    if name not in SEARCH_INPUTS:
         print("Invalid choice. Exiting.")
+        return
+    
+    search_input = await _load_search_input(prefetched, name)
+    if search_input is None:
+        return
+    keyword, label = SEARCH_INPUTS[name]
+    print(f"\nStarting pipeline with {len(search_input[keyword])} {label}...")
+    
+    # Create search scraper
+    from scrapers.searches_scraping import create_search_scraper
+    search_scraper = create_search_scraper()
+    
+    # Steps 1-2: Extract business URLs from search results, collecting website
+    # URLs (order-preserving dedup) as each extraction batch completes
+    search_result_count = 0
+    seen = set()
+    website_urls = []
+    async for result in search_scraper.extract_business_urls_from_searches_iter(
+        llm_extraction_method='crawl4ai',
+        **search_input
+    ):
+        search_result_count += 1
+        website_urls.extend(_dedup_urls((result,), seen))
+    
+    if not search_result_count:
+        print("No search results found. Pipeline terminated.")
+        return
+    
+    if not website_urls:
+        print("No website URLs extracted. Pipeline terminated.")
+        return
+    
+    print(f"Extracted {len(website_urls)} unique website URLs from search results.")
+    
+    # Steps 3-4: Select scraping method and scrape websites
+    method = await _prompt_scraping_method("Select website scraping method (direct/crawl4ai) [default: direct]: ")
+    print(f"Starting website scraping with method '{method}' for {len(website_urls)} URLs...")
+    await _scrape_menu_websites(website_urls, method, concurrency)
+
+
+async def _handle_exit(prefetched: Dict[str, asyncio.Task], concurrency: int) -> None:
+    """Exit without running anything"""
+    print("Exiting program.")
+
+
+# Menu choice -> handler; SCRAPER_CHOICES=2,4 runs choices in order without the menu,
+# taking prompt answers from SCRAPER_METHOD and SCRAPER_PIPELINE_INPUT
+MENU_HANDLERS = {
+    "1": _handle_websites,
+    "2": partial(_handle_search, "terms"),
+    "3": partial(_handle_search, "urls"),
+    "4": _handle_pipeline,
+    "5": _handle_exit,
+}
+
+
+# Operation mode -> entry point for `python main.py website|search|pipeline ...`
+CLI_MODES = {
+    "website": scrape_websites,
+    "search": scrape_searches,
+    "pipeline": run_pipeline,
+}
+
+
+async def run_cli(config: CrawlerConfig) -> None:
+    """Run the operation mode selected on the command line"""
+    await CLI_MODES[config.mode](config)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    setup_logging(console_level=logging.DEBUG if "--debug" in sys.argv[1:] else logging.INFO)
+    # A mode argument runs it directly; otherwise show the interactive menu
+    entry = run_cli(parse_arguments()) if any(arg in CLI_MODES for arg in sys.argv[1:]) else main()
+    asyncio.run(entry, loop_factory=uvloop.new_event_loop if uvloop else None)
\ No newline at end of file
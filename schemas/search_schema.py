@@ -4,17 +4,21 @@ search_schema.py
 Pydantic models for search result extraction and validation.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List, Optional
 
 class SearchContext(BaseModel):
     """Context of the search operation"""
+    model_config = ConfigDict(frozen=True)
+
     query: str = Field(..., description="Original search query")
     url: str = Field(..., description="Actual search URL used")
     results: int = Field(..., description="Total results found by search engine")
 
 class SearchResult(BaseModel):
     """Search operation outcome"""
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(..., description="URL extraction succeeded")
     urls_found: int = Field(..., description="Number of relevant URLs extracted")
     error: Optional[str] = Field(
@@ -28,16 +32,34 @@ class SearchResult(BaseModel):
 
 class SearchMetadata(BaseModel):
     """Search operation metadata"""
+    model_config = ConfigDict(frozen=True)
+
     context: SearchContext
     result: SearchResult
 
 class RelevantURL(BaseModel):
     """Relevant URL from search results"""
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Result title from search")
     reason: str = Field(..., description="Why this URL matches our criteria")
     url: str = Field(..., description="Complete, crawlable URL")
 
 class SearchExtractionResult(BaseModel):
     """Final structured search extraction"""
+    model_config = ConfigDict(frozen=True)
+
     metadata: SearchMetadata
-    urls: List[RelevantURL]
\ No newline at end of file
+    urls: List[RelevantURL]
+
+    @classmethod
+    def from_validated(cls, data: dict) -> "SearchExtractionResult":
+        """Rebuild from an already-validated model_dump() without re-running validation"""
+        metadata = data["metadata"]
+        return cls.model_construct(
+            metadata=SearchMetadata.model_construct(
+                context=SearchContext.model_construct(**metadata["context"]),
+                result=SearchResult.model_construct(**metadata["result"])
+            ),
+            urls=[RelevantURL.model_construct(**url) for url in data["urls"]]
+        )
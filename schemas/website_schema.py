@@ -5,11 +5,13 @@ Pydantic models for structured output from website content extraction.
 Focuses on business listings in the Dominican Republic.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Union
 
 class SourceMetadata(BaseModel):
     """Information about the crawled website"""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Website title or main heading")
     url: str = Field(..., description="Actual URL of the crawled page")
     type: Optional[str] = Field(
@@ -23,6 +25,8 @@ class SourceMetadata(BaseModel):
 
 class ExtractionResult(BaseModel):
     """Results of the data extraction process"""
+    model_config = ConfigDict(frozen=True)
+
     success: bool = Field(..., description="Extraction succeeded")
     entities_found: int = Field(..., description="Number of valid entities extracted")
     error: Optional[str] = Field(
@@ -36,12 +40,16 @@ class ExtractionResult(BaseModel):
 
 class RelevantURL(BaseModel):
     """URL potentially containing more target data"""
+    model_config = ConfigDict(frozen=True)
+
     title: str = Field(..., description="Page title or context")
     reason: str = Field(..., description="Why this URL is relevant to our goals")
     url: str = Field(..., description="Complete, crawlable URL")
 
 class ExtractionMetadata(BaseModel):
     """Comprehensive extraction metadata"""
+    model_config = ConfigDict(frozen=True)
+
     source: SourceMetadata
     result: ExtractionResult
     relevant_urls: List[RelevantURL] = Field(
@@ -51,6 +59,8 @@ class ExtractionMetadata(BaseModel):
 
 class BusinessEntity(BaseModel):
     """A business entity in the Dominican Republic"""
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Official business name")
     address: str = Field(..., description="Full physical address with city")
     phone: Optional[str] = Field(
@@ -80,5 +90,23 @@ class BusinessEntity(BaseModel):
 
 class WebsiteExtractionResult(BaseModel):
     """Final structured extraction output"""
+    model_config = ConfigDict(frozen=True)
+
     metadata: ExtractionMetadata
-    entities: List[BusinessEntity]
\ No newline at end of file
+    entities: List[BusinessEntity]
+
+    @classmethod
+    def from_validated(cls, data: dict) -> "WebsiteExtractionResult":
+        """Rebuild from an already-validated model_dump() without re-running validation"""
+        metadata = data["metadata"]
+        return cls.model_construct(
+            metadata=ExtractionMetadata.model_construct(
+                source=SourceMetadata.model_construct(**metadata["source"]),
+                result=ExtractionResult.model_construct(**metadata["result"]),
+                relevant_urls=[
+                    RelevantURL.model_construct(**url)
+                    for url in metadata.get("relevant_urls", ())
+                ]
+            ),
+            entities=[BusinessEntity.model_construct(**entity) for entity in data["entities"]]
+        )
@@ -1,16 +1,21 @@
 import os, sys
-from urllib.parse import quote_plus, urlencode
-from typing import List, Dict, Any, Optional
+import io
+from urllib.parse import quote_plus
+from typing import List, Dict, Any, Optional, Sequence
 from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache
+from enum import Enum, IntEnum
 
-class SearchType(Enum):
-    BUSINESSES = "businesses"
-    RESTAURANTS = "restaurants" 
-    ATTRACTIONS = "attractions"
-    SERVICES = "services"
-    HOTELS = "hotels"
-    GENERAL = "general"
+class SearchType(IntEnum):
+    BUSINESSES = 0
+    RESTAURANTS = 1
+    ATTRACTIONS = 2
+    SERVICES = 3
+    HOTELS = 4
+    GENERAL = 5
+
+# String name of each SearchType, indexed by the type
+SEARCH_TYPE_VALUES = ("businesses", "restaurants", "attractions", "services", "hotels", "general")
 
 class TimeFilter(Enum):
     ANY_TIME = ""
@@ -20,7 +25,7 @@ class TimeFilter(Enum):
     PAST_MONTH = "qdr:m"
     PAST_YEAR = "qdr:y"
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchConfig:
     search_term: str
     search_type: SearchType = SearchType.GENERAL
@@ -31,91 +36,146 @@ class SearchConfig:
     time_filter: TimeFilter = TimeFilter.ANY_TIME
     file_type: Optional[str] = None  # pdf, doc, xls, etc.
     exact_phrase: Optional[str] = None
-    exclude_words: Optional[List[str]] = None
-    include_words: Optional[List[str]] = None
+    exclude_words: Optional[Sequence[str]] = None
+    include_words: Optional[Sequence[str]] = None
     site_restrict: Optional[str] = None
     related_site: Optional[str] = None
-    include_domains: Optional[List[str]] = None
-    exclude_domains: Optional[List[str]] = None
+    include_domains: Optional[Sequence[str]] = None
+    exclude_domains: Optional[Sequence[str]] = None
+    
+    def __post_init__(self):
+        # Store word/domain lists as tuples so configs are hashable cache keys
+        for name in ('exclude_words', 'include_words', 'include_domains', 'exclude_domains'):
+            value = getattr(self, name)
+            if value is not None:
+                object.__setattr__(self, name, tuple(value))
+
+# site: operators used by every specialized URL, formatted once
+_DR_INCLUDE_OP = '(site:.do)'
+_DR_EXCLUDE_SOCIAL_OP = '-site:facebook.com -site:instagram.com -site:twitter.com'
+_DR_GENERAL_OPS = f"{_DR_INCLUDE_OP} {_DR_EXCLUDE_SOCIAL_OP}"
+
+@lru_cache(maxsize=64)
+def _static_params(language: str, country: str) -> str:
+    """Encoded lr/cr/gl/hl parameters; gl=DO geolocates and hl=es sets a Spanish interface"""
+    return f"lr={quote_plus(language)}&cr={quote_plus(country)}&gl=DO&hl=es"
+
+@lru_cache(maxsize=256)
+def _domain_operators(include_domains: tuple, exclude_domains: tuple) -> str:
+    """Pre-joined site: operators for a domain filter, shared by every URL using it"""
+    site_operators = []
+    if include_domains:
+        domain_group = " OR ".join([f"site:{domain}" for domain in include_domains])
+        site_operators.append(f"({domain_group})")
+    for domain in exclude_domains:
+        site_operators.append(f"-site:{domain}")
+    return " ".join(site_operators)
 
 class AdvancedGoogleSearchGenerator:
     def __init__(self):
         self.base_url = "https://www.google.com/search"
         
-        # Dominican Republic specific keywords for different categories
-        self.dr_keywords = {
-            SearchType.BUSINESSES: [
-                "empresas", "negocios", "directorio empresarial", "compañías", 
-                "industrias", "comercios", "pymes", "negocio dominicano"
-            ],
-            SearchType.RESTAURANTS: [
-                "restaurantes", "comida", "gastronomía", "cocina dominicana",
-                "donde comer", "comedor", "cafetería", "bar restaurante"
-            ],
-            SearchType.ATTRACTIONS: [
-                "lugares turísticos", "atracciones", "turismo", "que visitar",
-                "sitios de interés", "monumentos", "playas", "parques"
-            ],
-            SearchType.SERVICES: [
-                "servicios", "profesionales", "técnicos", "reparaciones",
-                "consultores", "servicios profesionales", "proveedores"
-            ],
-            SearchType.HOTELS: [
-                "hoteles", "hospedaje", "alojamiento", "resort", "pensión",
-                "apart hotel", "posada", "villa"
-            ]
-        }
+        # Dominican Republic specific keywords for different categories, indexed by SearchType
+        self.dr_keywords = (
+            # BUSINESSES
+            ("empresas", "negocios", "directorio empresarial", "compañías", 
+             "industrias", "comercios", "pymes", "negocio dominicano"),
+            # RESTAURANTS
+            ("restaurantes", "comida", "gastronomía", "cocina dominicana",
+             "donde comer", "comedor", "cafetería", "bar restaurante"),
+            # ATTRACTIONS
+            ("lugares turísticos", "atracciones", "turismo", "que visitar",
+             "sitios de interés", "monumentos", "playas", "parques"),
+            # SERVICES
+            ("servicios", "profesionales", "técnicos", "reparaciones",
+             "consultores", "servicios profesionales", "proveedores"),
+            # HOTELS
+            ("hoteles", "hospedaje", "alojamiento", "resort", "pensión",
+             "apart hotel", "posada", "villa"),
+            # GENERAL searches add no category keywords
+            ()
+        )
         
         # Dominican specific domains and sites
-        self.dr_domains = [
+        self.dr_domains = (
             "site:.do", "site:tripadvisor.com.do", "site:paginasamarillas.com.do",
             "site:listindiario.com", "site:diariolibre.com", "site:elcaribe.com.do",
             "site:dominicanaonline.org", "site:godominicanrepublic.com"
-        ]
+        )
         
         # Common Dominican cities for location-specific searches
-        self.dr_cities = [
+        self.dr_cities = (
             "Santo Domingo", "Santiago", "Puerto Plata", "La Romana", 
             "San Pedro de Macorís", "Punta Cana", "Boca Chica", "Samaná",
             "Barahona", "Monte Cristi", "Higüey", "Mao", "Bonao"
-        ]
+        )
+        # Default city-specific searches cover the top 3 cities
+        self._default_cities_top3 = self.dr_cities[:3]
+        
+        # Query fragments that are identical for every URL, joined once here
+        self._cat_suffix = tuple(
+            " ".join(f'"{keyword}"' for keyword in keywords[:2])
+            for keywords in self.dr_keywords
+        )
+        defaults = SearchConfig(search_term="")
+        self._static_params_qs = _static_params(defaults.language, defaults.country)
+        
+        # Per-instance URL cache; keyed on the (hashable, frozen) config only, and
+        # released together with the generator
+        self._search_url_cache = lru_cache(maxsize=1024)(self._build_search_url)
 
     def _build_search_query(self, config: SearchConfig) -> str:
         """Build the main search query with operators"""
-        query_parts = []
-        
         # Main search term
         base_term = config.search_term.strip()
         
+        # Common case: no optional word operators, so the query shape is fixed
+        if not (config.exact_phrase or config.include_words or config.exclude_words):
+            cat_suffix = self._cat_suffix[config.search_type]
+            if cat_suffix:
+                return f'{base_term} {cat_suffix} "{config.location}"'
+            return f'{base_term} "{config.location}"'
+        
+        # Operator-heavy queries are written into one buffer
+        buf = io.StringIO()
+        write = buf.write
+        write(base_term)
+        
         # Add exact phrase if specified
         if config.exact_phrase:
-            query_parts.append(f'"{config.exact_phrase}"')
+            write(' "')
+            write(config.exact_phrase)
+            write('"')
         
-        # Add category-specific keywords
-        if config.search_type != SearchType.GENERAL:
-            category_keywords = self.dr_keywords.get(config.search_type, [])
-            # Pick 2-3 most relevant keywords to avoid query bloat
-            selected_keywords = category_keywords[:2]
-            for keyword in selected_keywords:
-                query_parts.append(f'"{keyword}"')
+        # Add category-specific keywords (the 2 most relevant, to avoid query bloat)
+        cat_suffix = self._cat_suffix[config.search_type]
+        if cat_suffix:
+            write(" ")
+            write(cat_suffix)
         
         # Add location context
-        query_parts.append(f'"{config.location}"')
+        write(' "')
+        write(config.location)
+        write('"')
         
         # Include additional words (OR logic)
         if config.include_words:
-            include_phrase = " OR ".join([f'"{word}"' for word in config.include_words])
-            query_parts.append(f"({include_phrase})")
+            separator = ' ("'
+            for word in config.include_words:
+                write(separator)
+                write(word)
+                write('"')
+                separator = ' OR "'
+            write(")")
         
         # Exclude words
         if config.exclude_words:
             for word in config.exclude_words:
-                query_parts.append(f'-"{word}"')
-        
-        # Add base search term
-        query_parts.insert(0, base_term)
+                write(' -"')
+                write(word)
+                write('"')
         
-        return " ".join(query_parts)
+        return buf.getvalue()
 
     def _build_site_operators(self, config: SearchConfig) -> List[str]:
         """Build site-specific operators"""
@@ -129,20 +189,21 @@ class AdvancedGoogleSearchGenerator:
         if config.related_site:
             site_operators.append(f"related:{config.related_site}")
         
-        # Include specific domains
-        if config.include_domains:
-            domain_group = " OR ".join([f"site:{domain}" for domain in config.include_domains])
-            site_operators.append(f"({domain_group})")
-        
-        # Exclude domains
-        if config.exclude_domains:
-            for domain in config.exclude_domains:
-                site_operators.append(f"-site:{domain}")
+        # Include / exclude specific domains
+        if config.include_domains or config.exclude_domains:
+            site_operators.append(_domain_operators(
+                config.include_domains or (),
+                config.exclude_domains or ()
+            ))
         
         return site_operators
 
     def generate_search_url(self, config: SearchConfig) -> str:
-        """Generate advanced Google search URL"""
+        """Generate advanced Google search URL (cached per config)"""
+        return self._search_url_cache(config)
+
+    def _build_search_url(self, config: SearchConfig) -> str:
+        """Build the search URL for a config"""
         # Build main query
         main_query = self._build_search_query(config)
         
@@ -155,23 +216,19 @@ class AdvancedGoogleSearchGenerator:
         if config.file_type:
             main_query += f" filetype:{config.file_type}"
         
-        # Build URL parameters
-        params = {
-            'q': main_query,
-            'num': min(config.num_results, 100),  # Google limits to 100
-            'lr': config.language,
-            'cr': config.country,
-            'gl': 'DO',  # Geolocation for Dominican Republic
-            'hl': 'es'   # Interface language Spanish
-        }
-        
         # Add time filter
-        if config.time_filter != TimeFilter.ANY_TIME:
-            params['tbs'] = config.time_filter.value
+        tbs = ""
+        if config.time_filter is not TimeFilter.ANY_TIME:
+            tbs = f"&tbs={quote_plus(config.time_filter.value)}"
         
-        # Build final URL
-        encoded_params = urlencode(params, quote_via=quote_plus)
-        return f"{self.base_url}?{encoded_params}"
+        # Build final URL; only the query itself needs encoding per call (Google limits num to 100)
+        return (f"{self.base_url}?q={quote_plus(main_query)}&num={min(config.num_results, 100)}"
+                f"&{_static_params(config.language, config.country)}{tbs}")
+
+    def _term_with_keywords(self, base_term: str, search_type: SearchType) -> str:
+        """Search term followed by the category keywords of a search type"""
+        cat_suffix = self._cat_suffix[search_type]
+        return f"{base_term} {cat_suffix}" if cat_suffix else base_term
 
     def generate_specialized_urls(self, 
                                 base_search: str, 
@@ -183,45 +240,36 @@ class AdvancedGoogleSearchGenerator:
             search_types = [SearchType.BUSINESSES, SearchType.RESTAURANTS, 
                            SearchType.ATTRACTIONS, SearchType.SERVICES]
         
-        if cities is None:
-            cities = self.dr_cities[:5]  # Top 5 cities
-        
         urls = []
+        # Every URL shares the default filters; only the q parameter varies
+        base_term = base_search.strip()
+        url_prefix = f"{self.base_url}?q="
+        url_suffix = f"&num=100&{self._static_params_qs}"
         
         # Generate URLs for each search type
         for search_type in search_types:
-            config = SearchConfig(
-                search_term=base_search,
-                search_type=search_type,
-                location="República Dominicana",
-                include_domains=[".do"],
-                exclude_domains=["facebook.com", "instagram.com", "twitter.com"]
-            )
-            
-            url = self.generate_search_url(config)
+            query = f'{self._term_with_keywords(base_term, search_type)} "República Dominicana" {_DR_GENERAL_OPS}'
+            type_name = SEARCH_TYPE_VALUES[search_type]
             urls.append({
-                'type': search_type.value,
+                'type': type_name,
                 'location': 'General DR',
-                'url': url,
-                'description': f"Search for {search_type.value} related to '{base_search}' in Dominican Republic"
+                'url': f"{url_prefix}{quote_plus(query)}{url_suffix}",
+                'description': f"Search for {type_name} related to '{base_search}' in Dominican Republic"
             })
         
         # Generate city-specific URLs for top search type
         primary_type = search_types[0] if search_types else SearchType.BUSINESSES
-        for city in cities[:3]:  # Limit to top 3 cities
-            config = SearchConfig(
-                search_term=base_search,
-                search_type=primary_type,
-                location=city,
-                include_domains=[".do"]
-            )
-            
-            url = self.generate_search_url(config)
+        primary_name = SEARCH_TYPE_VALUES[primary_type]
+        primary_term = self._term_with_keywords(base_term, primary_type)
+        # Limit to top 3 cities
+        top_cities = self._default_cities_top3 if cities is None else cities[:3]
+        for city in top_cities:
+            query = f'{primary_term} "{city}" {_DR_INCLUDE_OP}'
             urls.append({
-                'type': f"{primary_type.value}_city",
+                'type': f"{primary_name}_city",
                 'location': city,
-                'url': url,
-                'description': f"Search for {primary_type.value} related to '{base_search}' in {city}"
+                'url': f"{url_prefix}{quote_plus(query)}{url_suffix}",
+                'description': f"Search for {primary_name} related to '{base_search}' in {city}"
             })
         
         return urls
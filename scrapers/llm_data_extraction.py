@@ -17,27 +17,21 @@ Created: 5/30/2025
 Updated: Enhanced for multi-schema support
 """
 
-import os
 import sys
 import json
 import asyncio
 import random
 import logging
 import traceback
-from typing import Dict, List, Any, Optional, Union, Type
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Any, Optional, Tuple, Union, Type
 from dataclasses import dataclass, field
 
-import litellm
 from pydantic import BaseModel, ValidationError
 
-# Add project root to Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.append(project_root)
-
+# Project-root packages resolve from the entry point (main.py, the backend, or
+# `python -m scrapers.llm_data_extraction` run from the project root)
 from logs.custom_logging import setup_logging
 from utils.helpers import save_debug_files, load_debug_files
-from crawl4ai import AsyncWebCrawler, CrawlerRunConfig, LLMConfig, BrowserConfig, CacheMode
-from crawl4ai.extraction_strategy import LLMExtractionStrategy
 from settings import (
     WEBSITES_DATA_EXTRACTION_PROMPT, 
     SEARCH_RESULTS_EXTRACTION_PROMPT,
@@ -46,16 +40,21 @@ from settings import (
 from schemas.website_schema import WebsiteExtractionResult
 from schemas.search_schema import SearchExtractionResult
 
+# litellm and crawl4ai are imported where they are first used, so importing this
+# module (e.g. only for ExtractionConfig) does not load their dependency trees
+if TYPE_CHECKING:
+    from crawl4ai import BrowserConfig, CrawlerRunConfig
+
 
-# Initialize module logger
-logger = setup_logging(console_level=logging.DEBUG)
+# Shared crawler logger; handlers are attached by setup_logging() in the entry point
+logger = logging.getLogger("YouTubeScraper")
 
 
 # =============================================================================
 # Configuration Classes
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExtractionConfig:
     """
     Configuration parameters for LLM data extraction operations.
@@ -65,28 +64,47 @@ class ExtractionConfig:
         max_retry_attempts: Maximum number of retry attempts for failed extractions
         retry_delay_seconds: Base delay between retry attempts in seconds
         enable_exponential_backoff: Whether to use exponential backoff for retries
+        retry_delays: Delay before each retry attempt, derived from the fields above
     """
     max_batch_size: int = 5
     max_retry_attempts: int = 2
     retry_delay_seconds: float = 1.0
     enable_exponential_backoff: bool = True
+    retry_delays: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.enable_exponential_backoff:
+            delays = tuple(self.retry_delay_seconds * 2 ** attempt for attempt in range(self.max_retry_attempts))
+        else:
+            delays = (self.retry_delay_seconds,) * self.max_retry_attempts
+        object.__setattr__(self, 'retry_delays', delays)
 
 
-@dataclass
+@dataclass(slots=True)
 class Crawl4AIConfig:
     """
     Configuration for Crawl4AI web crawler instances.
     
     Attributes:
-        browser_config: Browser-specific configuration settings
-        crawler_run_config: Runtime configuration for crawler operations
+        browser_config: Browser-specific configuration settings (headless by default)
+        crawler_run_config: Runtime configuration for crawler operations (cache bypass by default)
     """
-    browser_config: BrowserConfig = field(
-        default_factory=lambda: BrowserConfig(headless=True)
-    )
-    crawler_run_config: CrawlerRunConfig = field(
-        default_factory=lambda: CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
-    )
+    browser_config: Optional["BrowserConfig"] = None
+    crawler_run_config: Optional["CrawlerRunConfig"] = None
+    
+    def get_browser_config(self) -> "BrowserConfig":
+        """Return the browser configuration, creating the default on first use."""
+        if self.browser_config is None:
+            from crawl4ai import BrowserConfig
+            self.browser_config = BrowserConfig(headless=True)
+        return self.browser_config
+    
+    def get_crawler_run_config(self) -> "CrawlerRunConfig":
+        """Return the crawler run configuration, creating the default on first use."""
+        if self.crawler_run_config is None:
+            from crawl4ai import CrawlerRunConfig, CacheMode
+            self.crawler_run_config = CrawlerRunConfig(cache_mode=CacheMode.BYPASS)
+        return self.crawler_run_config
 
 
 # =============================================================================
@@ -236,9 +254,11 @@ class LLMDataExtractor:
         Raises:
             Exception: Re-raises unexpected exceptions after logging
         """
-        logger.debug(f"Starting direct API extraction for URL: '{source_url}'")
+        logger.debug("Starting direct API extraction for URL: '%s'", source_url)
         
         try:
+            import litellm
+            
             # Make async API call to LLM service
             api_response = await litellm.acompletion(
                 model=self.llm_configuration.get('provider'),
@@ -257,11 +277,9 @@ class LLMDataExtractor:
             raw_response_content = api_response.choices[0].message.content
             
             try:
-                # Parse JSON response
-                parsed_response = json.loads(raw_response_content)
-                
-                # Validate against Pydantic schema
-                validated_response = self.validation_schema(**parsed_response)
+                # Parse and validate against the Pydantic schema in one pass;
+                # invalid JSON is reported as a ValidationError
+                validated_response = self.validation_schema.model_validate_json(raw_response_content)
                 
                 logger.info(f"✅ Successfully extracted data via direct API for URL: {source_url}")
                 return validated_response.model_dump()
@@ -269,13 +287,13 @@ class LLMDataExtractor:
             except (json.JSONDecodeError, ValidationError) as validation_error:
                 error_message = f"Response validation failed: {str(validation_error)}"
                 logger.error(error_message)
-                logger.debug(f"Raw API response preview: {raw_response_content[:500]}...")
+                logger.debug("Raw API response preview: %.500s...", raw_response_content)
                 return self._create_standardized_error_response(error_message, source_url)
                 
         except Exception as api_error:
             error_message = f"Direct API request failed: {str(api_error)}"
             logger.error(error_message)
-            logger.debug(f"API error traceback: {traceback.format_exc()}")
+            logger.debug("API error traceback:", exc_info=True)
             return self._create_standardized_error_response(error_message, source_url)
     
     async def _extract_via_crawl4ai(
@@ -299,6 +317,9 @@ class LLMDataExtractor:
         logger.info(f"Starting Crawl4AI extraction for URL: '{source_url}'")
 
         try:
+            from crawl4ai import AsyncWebCrawler, LLMConfig
+            from crawl4ai.extraction_strategy import LLMExtractionStrategy
+            
             # Configure LLM extraction strategy
             llm_extraction_strategy = LLMExtractionStrategy(
                 llm_config=LLMConfig(
@@ -314,7 +335,7 @@ class LLMDataExtractor:
             )
             
             # Create crawler run configuration
-            crawler_run_config = self.crawl4ai_config.crawler_run_config.clone(
+            crawler_run_config = self.crawl4ai_config.get_crawler_run_config().clone(
                 extraction_strategy=llm_extraction_strategy,
             )
             
@@ -324,7 +345,7 @@ class LLMDataExtractor:
             return self._create_standardized_error_response(error_message, source_url)
 
         # Execute extraction with retry logic
-        async with AsyncWebCrawler(config=self.crawl4ai_config.browser_config) as crawler:
+        async with AsyncWebCrawler(config=self.crawl4ai_config.get_browser_config()) as crawler:
             for attempt_number in range(self.extraction_config.max_retry_attempts + 1):
                 try:
                     # Execute crawl and extraction
@@ -350,7 +371,7 @@ class LLMDataExtractor:
                         
                         # Retry logic
                         if attempt_number < self.extraction_config.max_retry_attempts:
-                            retry_delay = self._calculate_retry_delay(attempt_number)
+                            retry_delay = self.extraction_config.retry_delays[attempt_number]
                             logger.info(
                                 f"Retrying in {retry_delay:.1f}s "
                                 f"(attempt {attempt_number + 1}/{self.extraction_config.max_retry_attempts})"
@@ -366,7 +387,7 @@ class LLMDataExtractor:
                 except Exception as extraction_error:
                     error_message = f"Unexpected extraction error: {str(extraction_error)}"
                     logger.error(error_message)
-                    logger.debug(f"Extraction error traceback: {traceback.format_exc()}")
+                    logger.debug("Extraction error traceback:", exc_info=True)
                     return self._create_standardized_error_response(error_message, source_url)
 
     async def _process_extraction_result(
@@ -398,7 +419,7 @@ class LLMDataExtractor:
                     else:
                         error_message = "Invalid array structure in LLM response"
                         logger.error(error_message)
-                        logger.debug(f"Response preview: {extracted_content[:500]}...")
+                        logger.debug("Response preview: %.500s...", extracted_content)
                         return self._create_standardized_error_response(error_message, source_url)
                 else:
                     error_message = "Empty array received from LLM"
@@ -406,7 +427,7 @@ class LLMDataExtractor:
                     return self._create_standardized_error_response(error_message, source_url)
             
             # Validate against schema
-            validated_content = self.validation_schema(**parsed_content)
+            validated_content = self.validation_schema.model_validate(parsed_content)
             logger.info(f"✅ Successfully extracted and validated data via Crawl4AI for URL: {source_url}")
             
             return validated_content.model_dump()
@@ -414,7 +435,7 @@ class LLMDataExtractor:
         except (ValidationError, json.JSONDecodeError) as processing_error:
             error_message = f"Content processing failed: {str(processing_error)}"
             logger.error(error_message)
-            logger.debug(f"Content preview: {extracted_content[:500]}...")
+            logger.debug("Content preview: %.500s...", extracted_content)
             return self._create_standardized_error_response(error_message, source_url)
 
     def _is_valid_schema_structure(self, data: Dict[str, Any]) -> bool:
@@ -473,22 +494,21 @@ class LLMDataExtractor:
         return await asyncio.gather(*tasks)
 
 
-    async def execute_data_extraction(
+    async def iter_data_extraction(
         self, 
         extraction_method: str = 'crawl4ai'
-    ) -> List[Dict[str, Any]]:
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
         """
-        Execute the complete data extraction process.
+        Run data extraction batch by batch, yielding each batch's results as it completes.
         
-        This is the main entry point for data extraction. It processes all input
-        data in batches, handles errors gracefully, and provides comprehensive
-        progress reporting.
+        Lets callers start on early results while later batches are still being
+        processed. Failed batches yield one standardized error entry per item.
         
         Args:
             extraction_method: Method to use ('direct' or 'crawl4ai')
             
-        Returns:
-            List of extraction results with success/failure information
+        Yields:
+            List of extraction results for one batch
             
         Raises:
             ValueError: If extraction method is not supported
@@ -502,9 +522,9 @@ class LLMDataExtractor:
         # Validate input data
         if not self.input_data_list:
             logger.error("No input data available for extraction")
-            return [self._create_standardized_error_response("No input data provided")]
+            yield [self._create_standardized_error_response("No input data provided")]
+            return
         
-        extraction_results = []
         total_items = len(self.input_data_list)
         
         logger.info(f"Starting extraction of {total_items} items using method: {extraction_method}")
@@ -528,25 +548,52 @@ class LLMDataExtractor:
             try:
                 # Process current batch
                 batch_results = await self._process_extraction_batch(current_batch, extraction_method)
-                extraction_results.extend(batch_results)
                 
-                # Add inter-batch delay to avoid rate limiting
-                if batch_start_index + self.extraction_config.max_batch_size < total_items:
-                    inter_batch_delay = random.uniform(0.5, 1.5)
-                    logger.debug(f"Inter-batch delay: {inter_batch_delay:.2f}s")
-                    await asyncio.sleep(inter_batch_delay)
-                    
             except Exception as batch_error:
                 error_message = f"Batch {current_batch_number} processing failed: {str(batch_error)}"
                 logger.error(error_message)
-                logger.debug(f"Batch error traceback: {traceback.format_exc()}")
+                logger.debug("Batch error traceback:", exc_info=True)
                 
                 # Create error entries for each item in the failed batch
-                for batch_item in current_batch:
-                    item_url = next(iter(batch_item.keys())) if batch_item else "unknown"
-                    extraction_results.append(
-                        self._create_standardized_error_response(error_message, item_url)
+                batch_results = [
+                    self._create_standardized_error_response(
+                        error_message,
+                        next(iter(batch_item.keys())) if batch_item else "unknown"
                     )
+                    for batch_item in current_batch
+                ]
+                
+            yield batch_results
+            
+            # Add inter-batch delay to avoid rate limiting
+            if batch_start_index + self.extraction_config.max_batch_size < total_items:
+                inter_batch_delay = random.uniform(0.5, 1.5)
+                logger.debug("Inter-batch delay: %.2fs", inter_batch_delay)
+                await asyncio.sleep(inter_batch_delay)
+
+    async def execute_data_extraction(
+        self, 
+        extraction_method: str = 'crawl4ai'
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute the complete data extraction process.
+        
+        This is the main entry point for data extraction. It processes all input
+        data in batches, handles errors gracefully, and provides comprehensive
+        progress reporting.
+        
+        Args:
+            extraction_method: Method to use ('direct' or 'crawl4ai')
+            
+        Returns:
+            List of extraction results with success/failure information
+            
+        Raises:
+            ValueError: If extraction method is not supported
+        """
+        extraction_results = []
+        async for batch_results in self.iter_data_extraction(extraction_method):
+            extraction_results.extend(batch_results)
         
         # Calculate and log success metrics
         successful_extractions = self._count_successful_extractions(extraction_results)
@@ -556,12 +603,13 @@ class LLMDataExtractor:
         logger.info(f"✅ Extraction completed. Total results: {total_results}")
         logger.info(f"📊 Success rate: {success_rate:.1f}% ({successful_extractions}/{total_results})")
         
-        # Debug output (truncated)
-        results_json = json.dumps(extraction_results, indent=2)
-        if len(results_json) > 1000:
-            logger.debug(f"Results preview: {results_json[:1000]}...")
-        else:
-            logger.debug(f"Complete results: {results_json}")
+        # Debug output (truncated); serialized only when DEBUG records are handled
+        if logger.isEnabledFor(logging.DEBUG):
+            results_json = json.dumps(extraction_results, indent=2)
+            if len(results_json) > 1000:
+                logger.debug("Results preview: %s...", results_json[:1000])
+            else:
+                logger.debug("Complete results: %s", results_json)
         
         return extraction_results
 
@@ -656,6 +704,8 @@ if __name__ == "__main__":
     This block demonstrates how to use the LLMDataExtractor class
     with sample data and configurations for both schema types.
     """
+    setup_logging(console_level=logging.DEBUG)
+    
     try:
         # Load configuration and test data
         test_input_data = load_debug_files('debug_files/website_scraping/temp_processed_data.json')
@@ -26,7 +26,7 @@ import sys
 import asyncio
 import logging
 import traceback
-from typing import Dict, List, Any, Optional, Union
+from typing import AsyncIterator, Dict, List, Any, Optional, Union
 from dataclasses import dataclass
 from urllib.parse import urlencode, urlparse
 
@@ -41,8 +41,8 @@ from settings import SEARCH_RESULTS_EXTRACTION_PROMPT, LLM_CONFIG as default_llm
 from schemas.search_schema import SearchExtractionResult
 
 
-# Initialize module logger
-logger = setup_logging(console_level=logging.DEBUG)
+# Shared crawler logger; handlers are attached by setup_logging() in the entry point
+logger = logging.getLogger("YouTubeScraper")
 
 
 # =============================================================================
@@ -312,30 +312,24 @@ class SearchResultsScraper:
 
 
 
-    async def extract_business_urls_from_searches(
+    async def extract_business_urls_from_searches_iter(
         self,
         search_urls: Optional[List[str]] = None,
         search_terms: Optional[List[str]] = None,
         llm_extraction_method: str = 'crawl4ai',
         llm_configuration: Dict[str, Any] = None,
         extraction_config: ExtractionConfig = None
-    ) -> List[SearchExtractionResult]:
+    ) -> AsyncIterator[SearchExtractionResult]:
         """
-        Extract business URLs from search results using advanced LLM processing.
+        Extract business URLs from search results, yielding each validated result
+        as soon as its extraction batch completes.
         
-        This is the main entry point for the complete search-to-extraction pipeline.
-        It supports flexible input methods (direct URLs or search terms), performs
-        web scraping, and uses LLM-based extraction to identify relevant business URLs.
+        Takes the same arguments as extract_business_urls_from_searches; callers can
+        start working on early results while later batches are still being extracted.
+        Once every batch is done, the results are saved with save_output_data.
         
-        Args:
-            search_urls: Optional list of pre-generated search URLs
-            search_terms: Optional list of search terms to convert to URLs
-            llm_extraction_method: LLM extraction method ('direct' or 'crawl4ai')
-            llm_configuration: Optional LLM configuration (uses default if None)
-            extraction_config: Optional extraction configuration (uses default if None)
-            
-        Returns:
-            List of SearchExtractionResult objects containing extracted business URLs
+        Yields:
+            SearchExtractionResult objects containing extracted business URLs
             
         Raises:
             ValueError: If neither search_urls nor search_terms are provided
@@ -373,7 +367,7 @@ class SearchResultsScraper:
             
             if not scraped_search_data:
                 logger.warning("No search data was successfully scraped")
-                return []
+                return
             
             # Configure LLM extraction
             extraction_configuration = extraction_config or ExtractionConfig(
@@ -390,46 +384,38 @@ class SearchResultsScraper:
                 extraction_config=extraction_configuration
             )
             
-            # Execute LLM-based URL extraction
+            # Execute LLM-based URL extraction, converting each batch to schema objects.
+            # The extractor already validated every result against the schema, so
+            # rebuild the models without validating them a second time
             logger.info(f"Executing LLM extraction using method: {llm_extraction_method}")
-            extracted_business_urls = await search_url_extractor.execute_data_extraction(
+            extracted_results = []
+            total_urls_extracted = 0
+            async for batch_results in search_url_extractor.iter_data_extraction(
                 extraction_method=llm_extraction_method
-            )
+            ):
+                for extraction_result in batch_results:
+                    try:
+                        validated_result = SearchExtractionResult.from_validated(extraction_result)
+                    except Exception as validation_error:
+                        logger.warning(f"Result validation failed: {str(validation_error)}")
+                        continue
+                    extracted_results.append(extraction_result)
+                    total_urls_extracted += len(validated_result.urls)
+                    yield validated_result
             
-            if not extracted_business_urls:
+            if not extracted_results:
                 logger.warning("No business URLs were extracted from search results")
-                return []
-            
-            # Convert results to proper schema objects
-            validated_results = []
-            for extraction_result in extracted_business_urls:
-                try:
-                    validated_result = SearchExtractionResult(**extraction_result)
-                    validated_results.append(validated_result)
-                except Exception as validation_error:
-                    logger.warning(f"Result validation failed: {str(validation_error)}")
-                    continue
+                return
             
             # Calculate and log final metrics
-            total_urls_extracted = sum(
-                len(result.urls) for result in validated_results 
-                if hasattr(result, 'urls') and result.urls
-            )
-            
             logger.info(f"✅ Extraction completed successfully")
-            logger.info(f"📊 Results: {len(validated_results)} search results processed")
+            logger.info(f"📊 Results: {len(extracted_results)} search results processed")
             logger.info(f"📊 Total business URLs extracted: {total_urls_extracted}")
             
-            try:
-                validated_results_dict = [result.model_dump() for result in validated_results]
-            except Exception as e:
-                logger.warning(f'Error in validated_results_dict: {e}')
-            # Save final results for debugging and analysis
-            save_output_data(output_data=validated_results_dict, data_type='search')
+            # Save final results (already in model_dump form) for debugging and analysis
+            save_output_data(output_data=extracted_results, data_type='search')
             logger.debug("Final extraction results saved to debug files")
             
-            return validated_results
-            
         except Exception as extraction_error:
             error_message = f"Business URL extraction failed: {str(extraction_error)}"
             logger.error(f"❌ {error_message}")
@@ -438,6 +424,45 @@ class SearchResultsScraper:
             # Re-raise for proper error handling by caller
             raise
 
+    async def extract_business_urls_from_searches(
+        self,
+        search_urls: Optional[List[str]] = None,
+        search_terms: Optional[List[str]] = None,
+        llm_extraction_method: str = 'crawl4ai',
+        llm_configuration: Dict[str, Any] = None,
+        extraction_config: ExtractionConfig = None
+    ) -> List[SearchExtractionResult]:
+        """
+        Extract business URLs from search results using advanced LLM processing.
+        
+        This is the main entry point for the complete search-to-extraction pipeline.
+        It supports flexible input methods (direct URLs or search terms), performs
+        web scraping, and uses LLM-based extraction to identify relevant business URLs.
+        
+        Args:
+            search_urls: Optional list of pre-generated search URLs
+            search_terms: Optional list of search terms to convert to URLs
+            llm_extraction_method: LLM extraction method ('direct' or 'crawl4ai')
+            llm_configuration: Optional LLM configuration (uses default if None)
+            extraction_config: Optional extraction configuration (uses default if None)
+            
+        Returns:
+            List of SearchExtractionResult objects containing extracted business URLs
+            
+        Raises:
+            ValueError: If neither search_urls nor search_terms are provided
+            Exception: For critical processing failures
+        """
+        return [
+            result async for result in self.extract_business_urls_from_searches_iter(
+                search_urls=search_urls,
+                search_terms=search_terms,
+                llm_extraction_method=llm_extraction_method,
+                llm_configuration=llm_configuration,
+                extraction_config=extraction_config
+            )
+        ]
+
 
 # =============================================================================
 # Convenience Functions
@@ -515,13 +540,8 @@ async def process_search_terms(terms: List[str], job_id: Optional[str] = None) -
             llm_extraction_method='crawl4ai'
         )
         
-        # Collect all extracted URLs
-        all_urls = []
-        for result in results:
-            if hasattr(result, 'urls') and result.urls:
-                for url_info in result.urls:
-                    if hasattr(url_info, 'url'):
-                        all_urls.append(url_info.url)
+        # Collect all extracted URLs; urls and url are required schema fields
+        all_urls = [url_info.url for result in results for url_info in result.urls]
         
         return {
             "urls": all_urls,
@@ -561,13 +581,14 @@ async def process_search_urls(urls: List[str], job_id: Optional[str] = None) ->
             llm_extraction_method='crawl4ai'
         )
         
-        # Collect all extracted URLs
+        # Collect all extracted URLs (builtins and append bound to locals for the loop)
         all_urls = []
+        add_url, has_attr = all_urls.append, hasattr
         for result in results:
-            if hasattr(result, 'urls') and result.urls:
+            if has_attr(result, 'urls') and result.urls:
                 for url_info in result.urls:
-                    if hasattr(url_info, 'url'):
-                        all_urls.append(url_info.url)
+                    if has_attr(url_info, 'url'):
+                        add_url(url_info.url)
         
         return {
             "urls": all_urls,
@@ -596,6 +617,8 @@ if __name__ == "__main__":
     This block demonstrates how to use the SearchResultsScraper class
     with sample search terms and configurations.
     """
+    setup_logging(console_level=logging.DEBUG)
+    
     try:
         # Test configuration for development
         test_search_terms = [
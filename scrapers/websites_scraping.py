@@ -39,8 +39,8 @@ from scrapers.llm_data_extraction import create_website_extractor, ExtractionCon
 from settings import LLM_CONFIG as default_llm_config
 
 
-# Initialize module logger
-logger = setup_logging(console_level=logging.DEBUG)
+# Shared crawler logger; handlers are attached by setup_logging() in the entry point
+logger = logging.getLogger("YouTubeScraper")
 
 
 # =============================================================================
@@ -558,6 +558,8 @@ if __name__ == "__main__":
     This block demonstrates how to use the WebsitesScraping class
     with sample URLs and different scraping methods.
     """
+    setup_logging(console_level=logging.DEBUG)
+    
     # Sample URLs for testing
     test_urls = [
         # "https://www.yelu.do/category/restaurantes"
@@ -5,6 +5,7 @@ Add test business data to MongoDB for demonstration purposes
 import asyncio
 from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime
+from collections import Counter
 import random
 
 # Sample Dominican Republic businesses
@@ -131,6 +132,8 @@ async def add_test_data():
     for business in SAMPLE_BUSINESSES:
         business["created_at"] = datetime.utcnow()
         business["updated_at"] = datetime.utcnow()
+        # Indexed for the case-insensitive prefix search
+        business["name_lower"] = business["name"].lower()
         business["rating"] = f"{random.randint(35, 50)/10:.1f}"
         business["location"] = {
             "lat": 18.4861 + random.uniform(-2, 2),
@@ -141,6 +144,14 @@ async def add_test_data():
     result = await collection.insert_many(SAMPLE_BUSINESSES)
     print(f"Successfully added {len(result.inserted_ids)} test businesses to the database!")
     
+    # Keep the dashboard's materialized category counts in step
+    for category, count in Counter(b["category"] for b in SAMPLE_BUSINESSES).items():
+        await db.category_counts.update_one(
+            {"_id": category},
+            {"$inc": {"count": count}},
+            upsert=True
+        )
+    
     # Show some stats
     total = await collection.count_documents({})
     categories = await collection.distinct("category")
@@ -1,6 +1,7 @@
 import re
 import json
 import html
+import orjson
 import random
 import traceback
 from bs4 import BeautifulSoup
@@ -17,9 +18,9 @@ from concurrent.futures import ThreadPoolExecutor
 
 import os, sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from logs.custom_logging import setup_logging
 import logging
-logger = setup_logging(console_level=logging.DEBUG)
+# Shared crawler logger; handlers are attached by setup_logging() in the entry point
+logger = logging.getLogger("YouTubeScraper")
 
 
 
@@ -511,7 +512,7 @@ def deduplicate_data(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     for item in data:
         try:
             # Create a stable representation for comparison
-            serialized = json.dumps(item, sort_keys=True)
+            serialized = orjson.dumps(item, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
         except (TypeError, ValueError):
             logger.warning("Skipping unserializable item during deduplication")
             continue
@@ -559,8 +560,8 @@ def save_output_data(
         base_raw = f"output/raw/{data_type}_raw_data.json"
         base_cleaned = f"output/cleaned/{data_type}_cleaned_data.json"
         
-        # Timestamped backup paths
-        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Timestamped backup paths; microseconds keep saves within one second apart
+        timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         backup_raw = f"output/backups/{data_type}_raw_{timestamp_str}.json"
         backup_cleaned = f"output/backups/{data_type}_cleaned_{timestamp_str}.json"
         
@@ -568,9 +569,9 @@ def save_output_data(
         existing_raw = []
         if os.path.exists(base_raw) and os.path.getsize(base_raw) > 0:
             try:
-                with open(base_raw, "r", encoding="utf-8") as f:
-                    existing_raw = json.load(f)
-            except json.JSONDecodeError:
+                with open(base_raw, "rb") as f:
+                    existing_raw = orjson.loads(f.read())
+            except orjson.JSONDecodeError:
                 logger.warning(f"Raw {data_type} data file contains invalid JSON. Starting fresh.")
         
         # Combine and deduplicate
@@ -588,21 +589,26 @@ def save_output_data(
                 if isinstance(item, dict) and item.get("urls"):
                     cleaned_data.extend(item["urls"])
         
+        # Serialize once; the same bytes go to the backup and the main file.
+        # Written with json for the files' 4-space indent (orjson only indents by 2)
+        raw_payload = json.dumps(final_raw, indent=4, ensure_ascii=False).encode("utf-8")
+        cleaned_payload = json.dumps(cleaned_data, indent=4, ensure_ascii=False).encode("utf-8")
+        
         # Create backups before overwriting
         if timestamp:
             try:
-                with open(backup_raw, "w", encoding="utf-8") as f:
-                    json.dump(final_raw, f, indent=4, ensure_ascii=False)
-                with open(backup_cleaned, "w", encoding="utf-8") as f:
-                    json.dump(cleaned_data, f, indent=4, ensure_ascii=False)
+                with open(backup_raw, "wb") as f:
+                    f.write(raw_payload)
+                with open(backup_cleaned, "wb") as f:
+                    f.write(cleaned_payload)
             except Exception as e:
                 logger.error(f"Error creating backups: {str(e)}")
         
         # Save main files
-        with open(base_raw, "w", encoding="utf-8") as f:
-            json.dump(final_raw, f, indent=4, ensure_ascii=False)
-        with open(base_cleaned, "w", encoding="utf-8") as f:
-            json.dump(cleaned_data, f, indent=4, ensure_ascii=False)
+        with open(base_raw, "wb") as f:
+            f.write(raw_payload)
+        with open(base_cleaned, "wb") as f:
+            f.write(cleaned_payload)
         
         # Log success
         logger.info(
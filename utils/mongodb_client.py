@@ -1,9 +1,9 @@
 import os
 import asyncio
-from motor.motor_asyncio import AsyncIOMotorClient
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
+from logs.mongodb_logging import get_motor_client, release_motor_client
 
 logger = logging.getLogger(__name__)
 
@@ -17,14 +17,16 @@ class MongoDBClient:
     async def connect(self):
         """Connect to MongoDB"""
         if not self.client:
-            self.client = AsyncIOMotorClient(self.mongodb_url)
+            self.client = get_motor_client(self.mongodb_url)
             self.database = self.client[self.database_name]
             logger.info(f"Connected to MongoDB at {self.mongodb_url}")
     
     async def close(self):
-        """Close MongoDB connection"""
+        """Drop this client's reference to the shared MongoDB connection"""
         if self.client:
-            self.client.close()
+            release_motor_client(self.mongodb_url)
+            self.client = None
+            self.database = None
             logger.info("Closed MongoDB connection")
     
     async def save_businesses(self, businesses: List[Dict[str, Any]], source_type: str = "website"):
@@ -41,6 +43,12 @@ class MongoDBClient:
             business["updated_at"] = datetime.utcnow()
             business["source_type"] = source_type
             
+            # Store the shape the API serves so reads need no fixups
+            if isinstance(business.get("hours"), str):
+                business["hours"] = {"text": business["hours"]}
+            if "source_url" not in business:
+                business["source_url"] = business.get("url", "")
+            
             # Check for duplicates by name and address
             existing = None
             if business.get("name") and business.get("address"):
@@ -56,20 +64,42 @@ class MongoDBClient:
             if existing:
                 # Merge data
                 merged = self._merge_business_data(existing, business)
+                self._set_name_lower(merged)
                 await collection.update_one(
                     {"_id": existing["_id"]},
                     {"$set": merged}
                 )
+                if merged.get("category") != existing.get("category"):
+                    await self._adjust_category_count(existing.get("category"), -1)
+                    await self._adjust_category_count(merged.get("category"), 1)
                 updated_count += 1
             else:
                 # New business
                 business["created_at"] = datetime.utcnow()
+                self._set_name_lower(business)
                 await collection.insert_one(business)
+                await self._adjust_category_count(business.get("category"), 1)
                 saved_count += 1
         
         logger.info(f"Saved {saved_count} new businesses, updated {updated_count} existing")
         return {"saved": saved_count, "updated": updated_count}
     
+    @staticmethod
+    def _set_name_lower(business: Dict[str, Any]):
+        """Store the lowercased name that the case-insensitive prefix search is indexed on"""
+        if isinstance(business.get("name"), str):
+            business["name_lower"] = business["name"].lower()
+    
+    async def _adjust_category_count(self, category: Optional[str], delta: int):
+        """Keep the materialized category_counts collection in step with businesses"""
+        if not isinstance(category, str):
+            return
+        await self.database.category_counts.update_one(
+            {"_id": category},
+            {"$inc": {"count": delta}},
+            upsert=True
+        )
+    
     def _merge_business_data(self, existing: Dict, new: Dict) -> Dict:
         """Merge business data, preferring non-null new values"""
         merged = existing.copy()